@@ -0,0 +1,73 @@
+"""task_filter_indexes
+
+Revision ID: 3f9c2a7d1b64
+Revises: ed5d51860825
+Create Date: 2026-10-17 09:12:44.518203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9c2a7d1b64'
+down_revision: Union[str, Sequence[str], None] = 'ed5d51860825'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LIVE_TASKS = sa.text('is_deleted = false')
+
+TASK_INDEXES = [
+    ('ix_tasks_live_created_at', ['created_at', 'id'], {}),
+    ('ix_tasks_live_updated_at', ['updated_at', 'id'], {}),
+    ('ix_tasks_live_due_date', ['due_date', 'id'], {}),
+    ('ix_tasks_live_title', ['title', 'id'], {}),
+    ('ix_tasks_live_status', ['status', 'created_at'], {}),
+    ('ix_tasks_live_priority', ['priority', 'created_at'], {}),
+    ('ix_tasks_live_assigned_to', ['assigned_to', 'status'], {}),
+    ('ix_tasks_live_tags', ['tags'], {'postgresql_using': 'gin'}),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Built concurrently so large tables keep accepting writes meanwhile;
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        for name, columns, kwargs in TASK_INDEXES:
+            op.create_index(
+                name,
+                'tasks',
+                columns,
+                postgresql_where=LIVE_TASKS,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+                **kwargs,
+            )
+        op.create_index(
+            'ix_comments_task_id_created_at',
+            'comments',
+            ['task_id', 'created_at'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_files_task_id',
+            'files',
+            ['task_id'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_files_task_id', table_name='files', postgresql_concurrently=True)
+        op.drop_index(
+            'ix_comments_task_id_created_at', table_name='comments', postgresql_concurrently=True
+        )
+        for name, _, _ in reversed(TASK_INDEXES):
+            op.drop_index(name, table_name='tasks', postgresql_concurrently=True)
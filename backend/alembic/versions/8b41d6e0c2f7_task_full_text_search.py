@@ -0,0 +1,74 @@
+"""task_full_text_search
+
+Revision ID: 8b41d6e0c2f7
+Revises: 3f9c2a7d1b64
+Create Date: 2026-10-17 10:03:18.274591
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b41d6e0c2f7'
+down_revision: Union[str, Sequence[str], None] = '3f9c2a7d1b64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LIVE_TASKS = sa.text('is_deleted = false')
+
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B')"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.add_column(
+        'tasks',
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_VECTOR_SQL, persisted=True),
+            nullable=True,
+        ),
+    )
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tasks_live_search_vector',
+            'tasks',
+            ['search_vector'],
+            postgresql_using='gin',
+            postgresql_where=LIVE_TASKS,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        for column in ('title', 'description'):
+            op.create_index(
+                f'ix_tasks_live_{column}_trgm',
+                'tasks',
+                [column],
+                postgresql_using='gin',
+                postgresql_ops={column: 'gin_trgm_ops'},
+                postgresql_where=LIVE_TASKS,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name in (
+            'ix_tasks_live_description_trgm',
+            'ix_tasks_live_title_trgm',
+            'ix_tasks_live_search_vector',
+        ):
+            op.drop_index(name, table_name='tasks', postgresql_concurrently=True)
+    op.drop_column('tasks', 'search_vector')
@@ -0,0 +1,28 @@
+"""file_sha256
+
+Revision ID: a6c4e8f21d93
+Revises: f3a8d25c6b71
+Create Date: 2026-10-17 18:20:44.905317
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6c4e8f21d93'
+down_revision: Union[str, Sequence[str], None] = 'f3a8d25c6b71'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('files', sa.Column('sha256', sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('files', 'sha256')
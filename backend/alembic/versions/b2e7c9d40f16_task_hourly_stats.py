@@ -0,0 +1,73 @@
+"""task_hourly_stats
+
+Revision ID: b2e7c9d40f16
+Revises: a6c4e8f21d93
+Create Date: 2026-10-17 19:05:31.226740
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2e7c9d40f16'
+down_revision: Union[str, Sequence[str], None] = 'a6c4e8f21d93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Hours are truncated in UTC whatever the session's TimeZone is.
+BACKFILL = """
+INSERT INTO task_hourly_stats (hour, assignee_id, created, completed)
+SELECT hour, assignee_id, sum(created), sum(completed)
+FROM (
+    SELECT timezone('UTC', date_trunc('hour', timezone('UTC', created_at))) AS hour,
+           coalesce(assigned_to, '00000000-0000-0000-0000-000000000000') AS assignee_id,
+           1 AS created, 0 AS completed
+    FROM tasks WHERE is_deleted = false
+    UNION ALL
+    SELECT timezone('UTC', date_trunc('hour', timezone('UTC', completed_at))),
+           coalesce(assigned_to, '00000000-0000-0000-0000-000000000000'),
+           0, 1
+    FROM tasks WHERE is_deleted = false AND completed_at IS NOT NULL
+) counted
+GROUP BY hour, assignee_id
+"""
+
+RESTORE_DAILY = """
+INSERT INTO task_daily_stats (day, assignee_id, created, completed)
+SELECT CAST(timezone('UTC', hour) AS date), assignee_id, sum(created), sum(completed)
+FROM task_hourly_stats
+GROUP BY 1, assignee_id
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('task_hourly_stats',
+    sa.Column('hour', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('assignee_id', sa.UUID(), nullable=False),
+    sa.Column('created', sa.Integer(), nullable=False),
+    sa.Column('completed', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('hour', 'assignee_id')
+    )
+    op.create_index('ix_task_hourly_stats_assignee_id_hour', 'task_hourly_stats', ['assignee_id', 'hour'], unique=False)
+    op.execute(BACKFILL)
+    op.drop_index('ix_task_daily_stats_assignee_id_day', table_name='task_daily_stats')
+    op.drop_table('task_daily_stats')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_table('task_daily_stats',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('assignee_id', sa.UUID(), nullable=False),
+    sa.Column('created', sa.Integer(), nullable=False),
+    sa.Column('completed', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('day', 'assignee_id')
+    )
+    op.create_index('ix_task_daily_stats_assignee_id_day', 'task_daily_stats', ['assignee_id', 'day'], unique=False)
+    op.execute(RESTORE_DAILY)
+    op.drop_index('ix_task_hourly_stats_assignee_id_hour', table_name='task_hourly_stats')
+    op.drop_table('task_hourly_stats')
@@ -0,0 +1,34 @@
+"""user_token_epochs
+
+Revision ID: c5e2f19a7d03
+Revises: 8b41d6e0c2f7
+Create Date: 2026-10-17 14:05:31.774012
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5e2f19a7d03'
+down_revision: Union[str, Sequence[str], None] = '8b41d6e0c2f7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('user_token_epochs',
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('epoch', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('user_token_epochs')
@@ -0,0 +1,54 @@
+"""task_daily_stats
+
+Revision ID: d91a4c7e2b58
+Revises: c5e2f19a7d03
+Create Date: 2026-10-17 15:20:08.403118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd91a4c7e2b58'
+down_revision: Union[str, Sequence[str], None] = 'c5e2f19a7d03'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL = """
+INSERT INTO task_daily_stats (day, assignee_id, created, completed)
+SELECT day, assignee_id, sum(created), sum(completed)
+FROM (
+    SELECT CAST(timezone('UTC', created_at) AS date) AS day,
+           coalesce(assigned_to, '00000000-0000-0000-0000-000000000000') AS assignee_id,
+           1 AS created, 0 AS completed
+    FROM tasks WHERE is_deleted = false
+    UNION ALL
+    SELECT CAST(timezone('UTC', updated_at) AS date),
+           coalesce(assigned_to, '00000000-0000-0000-0000-000000000000'),
+           0, 1
+    FROM tasks WHERE is_deleted = false AND status = 'DONE'
+) counted
+GROUP BY day, assignee_id
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('task_daily_stats',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('assignee_id', sa.UUID(), nullable=False),
+    sa.Column('created', sa.Integer(), nullable=False),
+    sa.Column('completed', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('day', 'assignee_id')
+    )
+    op.create_index('ix_task_daily_stats_assignee_id_day', 'task_daily_stats', ['assignee_id', 'day'], unique=False)
+    op.execute(BACKFILL)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_task_daily_stats_assignee_id_day', table_name='task_daily_stats')
+    op.drop_table('task_daily_stats')
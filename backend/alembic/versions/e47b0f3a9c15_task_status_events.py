@@ -0,0 +1,75 @@
+"""task_status_events
+
+Revision ID: e47b0f3a9c15
+Revises: d91a4c7e2b58
+Create Date: 2026-10-17 16:02:51.227940
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e47b0f3a9c15'
+down_revision: Union[str, Sequence[str], None] = 'd91a4c7e2b58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TASK_STATUS = postgresql.ENUM('TODO', 'IN_PROGRESS', 'DONE', name='taskstatus', create_type=False)
+
+# updated_at is the best completion time available for tasks finished before
+# this migration; it is also what the daily rollup counted them under.
+BACKFILL_COMPLETED_AT = "UPDATE tasks SET completed_at = updated_at WHERE status = 'DONE'"
+
+BACKFILL_EVENTS = """
+INSERT INTO task_status_events (id, task_id, from_status, to_status, assignee_id, changed_by, created_at)
+SELECT gen_random_uuid(), id, NULL, 'DONE', assigned_to, NULL, completed_at
+FROM tasks WHERE completed_at IS NOT NULL
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('tasks', sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True))
+    op.execute(BACKFILL_COMPLETED_AT)
+
+    op.create_table('task_status_events',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('task_id', sa.UUID(), nullable=False),
+    sa.Column('from_status', TASK_STATUS, nullable=True),
+    sa.Column('to_status', TASK_STATUS, nullable=False),
+    sa.Column('assignee_id', sa.UUID(), nullable=True),
+    sa.Column('changed_by', sa.UUID(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.ForeignKeyConstraint(['changed_by'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['task_id'], ['tasks.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_task_status_events_task_id_to_status', 'task_status_events', ['task_id', 'to_status', 'created_at'], unique=False)
+    op.create_index('ix_task_status_events_completed', 'task_status_events', ['created_at', 'assignee_id'], unique=False, postgresql_where=sa.text("to_status = 'DONE'"))
+    op.execute(BACKFILL_EVENTS)
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tasks_live_completed_at',
+            'tasks',
+            ['assigned_to', 'completed_at'],
+            postgresql_where=sa.text('is_deleted = false AND completed_at IS NOT NULL'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_tasks_live_completed_at', table_name='tasks', postgresql_concurrently=True
+        )
+    op.drop_index('ix_task_status_events_completed', table_name='task_status_events', postgresql_where=sa.text("to_status = 'DONE'"))
+    op.drop_index('ix_task_status_events_task_id_to_status', table_name='task_status_events')
+    op.drop_table('task_status_events')
+    op.drop_column('tasks', 'completed_at')
@@ -0,0 +1,50 @@
+"""export_jobs
+
+Revision ID: f3a8d25c6b71
+Revises: e47b0f3a9c15
+Create Date: 2026-10-17 16:42:08.316204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a8d25c6b71'
+down_revision: Union[str, Sequence[str], None] = 'e47b0f3a9c15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('export_jobs',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('format', sa.String(length=10), nullable=False),
+    sa.Column('compression', sa.String(length=10), nullable=True),
+    sa.Column('assigned_to', sa.UUID(), nullable=True),
+    sa.Column('status', sa.Enum('PENDING', 'RUNNING', 'COMPLETED', 'FAILED', name='exportjobstatus'), nullable=False),
+    sa.Column('total_rows', sa.Integer(), nullable=True),
+    sa.Column('rows_written', sa.Integer(), nullable=False),
+    sa.Column('size', sa.BigInteger(), nullable=True),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('heartbeat_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('expires_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_export_jobs_expires_at'), 'export_jobs', ['expires_at'], unique=False)
+    op.create_index(op.f('ix_export_jobs_user_id'), 'export_jobs', ['user_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_export_jobs_user_id'), table_name='export_jobs')
+    op.drop_index(op.f('ix_export_jobs_expires_at'), table_name='export_jobs')
+    op.drop_table('export_jobs')
+    sa.Enum(name='exportjobstatus').drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,217 @@
+import asyncio
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from importlib import import_module
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class CacheBackend(ABC):
+    """Interface for the result caches.
+
+    The in-process ``TTLCache`` is the default; a shared store (e.g. one used
+    by several uvicorn workers) can be plugged in by subclassing this and
+    pointing the relevant ``*_CACHE_BACKEND`` setting at it. Every method is
+    abstract, so an incomplete backend fails when it is created.
+    """
+
+    @abstractmethod
+    def get(self, key: Hashable) -> Optional[Any]:
+        ...
+
+    @abstractmethod
+    def set(self, key: Hashable, value: Any) -> None:
+        ...
+
+    @abstractmethod
+    def delete(self, key: Hashable) -> None:
+        ...
+
+    @abstractmethod
+    def keys(self) -> List[Hashable]:
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        ...
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        ...
+
+
+class TTLCache(CacheBackend):
+    """Small in-process cache with per-entry expiry and a size bound.
+
+    When full, the least recently used entry is evicted first.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 30.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def keys(self) -> List[Hashable]:
+        with self._lock:
+            return list(self._data)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "backend": "memory",
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+_registry: Dict[str, CacheBackend] = {}
+
+
+def create_cache(name: str, backend: str = "memory", **options) -> CacheBackend:
+    """Build a cache and register it under ``name`` for ``cache_stats()``.
+
+    ``backend`` is ``"memory"`` for ``TTLCache`` or a ``"module:factory"``
+    path to a callable returning a ``CacheBackend``; ``options`` (maxsize,
+    ttl) are passed through either way.
+    """
+    if backend in ("", "memory"):
+        cache: CacheBackend = TTLCache(**options)
+    else:
+        module_name, _, attr = backend.partition(":")
+        cache = getattr(import_module(module_name), attr)(**options)
+    _registry[name] = cache
+    return cache
+
+
+def cache_stats() -> Dict[str, Dict[str, Any]]:
+    return {name: cache.stats() for name, cache in _registry.items()}
+
+
+class StaleWhileRevalidate:
+    """Serves cached values while refreshing them in the background.
+
+    Entries younger than ``soft_ttl`` are served as is. Between ``soft_ttl``
+    and ``hard_ttl`` the cached value is still served immediately, but one
+    background refresh per key is started. Past ``hard_ttl`` the entry has
+    expired from the store and the caller waits for a fresh value; concurrent
+    misses for a key wait for the same computation.
+    """
+
+    def __init__(self, store: CacheBackend, soft_ttl: float, hard_ttl: float):
+        self.store = store
+        self.soft_ttl = soft_ttl
+        self.hard_ttl = hard_ttl
+        self._refreshing: Set[Hashable] = set()
+        self._loading: Dict[Hashable, asyncio.Future] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def get(
+        self,
+        key: Hashable,
+        load: Callable[[], Awaitable[Any]],
+        refresh: Optional[Callable[[], Awaitable[Any]]] = None,
+    ) -> Tuple[Any, float]:
+        """Return ``(value, computed_at)`` with ``computed_at`` a Unix timestamp.
+
+        ``load`` computes the value on a miss. ``refresh`` (default ``load``)
+        runs in a background task, after the request that triggered it may
+        have finished, so it must not rely on request-scoped resources.
+        """
+        entry = self.store.get(key)
+        if entry is not None:
+            computed_at, value = entry
+            if time.time() - computed_at >= self.soft_ttl and key not in self._refreshing:
+                self._refreshing.add(key)
+                task = asyncio.create_task(self._refresh(key, refresh or load))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+            return value, computed_at
+
+        while True:
+            pending = self._loading.get(key)
+            if pending is None:
+                return await self._load(key, load)
+            try:
+                # Shielded: a waiter going away must not cancel everyone's load.
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+                # The request computing it went away; the next waiter takes over.
+
+    async def _load(
+        self, key: Hashable, load: Callable[[], Awaitable[Any]]
+    ) -> Tuple[Any, float]:
+        pending = asyncio.get_running_loop().create_future()
+        self._loading[key] = pending
+        try:
+            computed_at = time.time()
+            value = await load()
+            self.store.set(key, (computed_at, value))
+            pending.set_result((value, computed_at))
+            return value, computed_at
+        except asyncio.CancelledError:
+            pending.cancel()
+            raise
+        except Exception as exc:
+            pending.set_exception(exc)
+            pending.exception()  # retrieved here; waiters re-raise it themselves
+            raise
+        finally:
+            del self._loading[key]
+
+    async def _refresh(self, key: Hashable, refresh: Callable[[], Awaitable[Any]]) -> None:
+        try:
+            computed_at = time.time()
+            self.store.set(key, (computed_at, await refresh()))
+        except Exception:
+            logger.exception("Background refresh failed for %r", key)
+        finally:
+            self._refreshing.discard(key)
@@ -14,6 +14,28 @@ class Settings(BaseSettings):
     MAX_UPLOAD_SIZE: int = 5_242_880  # 5MB
     CORS_ORIGINS: str = "http://localhost:5173"
 
+    TASK_COUNT_CACHE_TTL: int = 30  # seconds
+    TASK_COUNT_CACHE_SIZE: int = 1024
+    TASK_LIST_CACHE_BACKEND: str = "memory"  # or "module:factory" for a shared store
+    TASK_LIST_CACHE_TTL: int = 10  # seconds
+    TASK_LIST_CACHE_SIZE: int = 512
+    RATE_LIMIT_BACKEND: str = "file"  # "memory", "file" or "module:factory"
+    RATE_LIMIT_FILE: str = ""  # defaults to <tempdir>/task-manager-ratelimit.bin
+    RATE_LIMIT_SLOTS: int = 65536
+    RATE_LIMIT_BUDGET: str = "600/minute"  # cost units per user for expensive routes
+    STATELESS_AUTH: bool = False  # embed identity claims in access tokens
+    TOKEN_EPOCH_REFRESH_SECONDS: int = 30
+    ANALYTICS_CACHE_SOFT_TTL: int = 30  # seconds before a background refresh
+    ANALYTICS_CACHE_HARD_TTL: int = 300  # seconds before callers wait for a refresh
+    ANALYTICS_CACHE_SIZE: int = 256
+    EXPORT_JOB_TTL_HOURS: int = 24  # finished exports are deleted after this
+    EXPORT_JOB_REAP_SECONDS: int = 300
+    EXPORT_JOB_STALE_SECONDS: int = 600  # running jobs without progress this long failed
+    PRINCIPAL_CACHE_TTL: int = 60  # seconds
+    PRINCIPAL_CACHE_SIZE: int = 4096
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_PENDING: int = 32  # queued + running before 503
+
     MAIL_USERNAME: str = ""
     MAIL_PASSWORD: str = ""
     MAIL_FROM: str = "noreply@taskflow.app"
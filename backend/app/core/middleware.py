@@ -1,15 +1,79 @@
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
-
-
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next) -> Response:
-        response = await call_next(request)
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        response.headers["Permissions-Policy"] = "camera=(), microphone=(), geolocation=()"
-        response.headers["Cache-Control"] = "no-store"
-        return response
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+RawHeaders = Tuple[Tuple[bytes, bytes], ...]
+
+DEFAULT_SECURITY_HEADERS: Dict[str, str] = {
+    "X-Content-Type-Options": "nosniff",
+    "X-Frame-Options": "DENY",
+    "X-XSS-Protection": "1; mode=block",
+    "Referrer-Policy": "strict-origin-when-cross-origin",
+    "Permissions-Policy": "camera=(), microphone=(), geolocation=()",
+    "Content-Security-Policy": "default-src 'none'; frame-ancestors 'none'",
+    "Cache-Control": "no-store",
+}
+
+# Path prefix -> header overrides; None drops a default header. The longest
+# matching prefix wins.
+DEFAULT_ROUTE_POLICIES: Dict[str, Dict[str, Optional[str]]] = {
+    # Swagger UI and ReDoc load scripts and styles from a CDN.
+    "/docs": {"Content-Security-Policy": None},
+    "/redoc": {"Content-Security-Policy": None},
+}
+
+
+def _encode(headers: Mapping[str, Optional[str]]) -> RawHeaders:
+    return tuple(
+        (name.lower().encode("latin-1"), value.encode("latin-1"))
+        for name, value in headers.items()
+        if value is not None
+    )
+
+
+class SecurityHeadersMiddleware:
+    """Adds security headers to every HTTP response.
+
+    Plain ASGI: header tuples are encoded once at startup and appended to the
+    ``http.response.start`` message, so there are no extra tasks or body
+    streams per request and streaming responses pass straight through.
+    Headers the route already set (e.g. ``Cache-Control`` on ETag routes)
+    are left alone.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        headers: Mapping[str, str] = DEFAULT_SECURITY_HEADERS,
+        policies: Mapping[str, Mapping[str, Optional[str]]] = DEFAULT_ROUTE_POLICIES,
+    ):
+        self.app = app
+        self.default = _encode(headers)
+        self.policies: List[Tuple[str, RawHeaders]] = sorted(
+            ((prefix, _encode({**headers, **overrides})) for prefix, overrides in policies.items()),
+            key=lambda policy: len(policy[0]),
+            reverse=True,
+        )
+
+    def headers_for(self, path: str) -> RawHeaders:
+        for prefix, headers in self.policies:
+            if path.startswith(prefix):
+                return headers
+        return self.default
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        extra = self.headers_for(scope["path"])
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", ()))
+                present = {name.lower() for name, _ in headers}
+                headers.extend(header for header in extra if header[0] not in present)
+                message["headers"] = headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
@@ -1,4 +1,234 @@
-from slowapi import Limiter
-from slowapi.util import get_remote_address
+import fcntl
+import functools
+import hashlib
+import math
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from importlib import import_module
+from typing import Callable, Dict, Optional, Tuple
 
-limiter = Limiter(key_func=get_remote_address, default_limits=["200/minute"])
+from starlette.requests import Request
+
+from app.core.config import get_settings
+from app.core.security import decode_token
+from app.utils.exceptions import RateLimitedException
+
+settings = get_settings()
+
+_PERIODS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+
+
+def parse_rate(spec: str) -> Tuple[float, float]:
+    """``"5/minute"`` -> (capacity 5, refill 5/60 tokens per second)."""
+    amount, _, period = spec.partition("/")
+    capacity = float(amount)
+    return capacity, capacity / _PERIODS[period.strip().rstrip("s")]
+
+
+def _refill(tokens: float, updated: float, now: float, capacity: float, rate: float) -> float:
+    return min(capacity, tokens + max(0.0, now - updated) * rate)
+
+
+class BucketStore(ABC):
+    """Storage for token buckets.
+
+    ``take`` refills the bucket for the time elapsed since it was last
+    touched, then spends ``cost`` tokens if it can, and returns
+    ``(allowed, tokens_left, retry_after_seconds)``. A missing bucket starts
+    full. Implementations must do this atomically per key.
+    """
+
+    @abstractmethod
+    def take(
+        self, key: str, capacity: float, rate: float, cost: float = 1.0
+    ) -> Tuple[bool, float, float]:
+        ...
+
+
+def _spend(tokens: float, capacity: float, rate: float, cost: float) -> Tuple[bool, float, float]:
+    if tokens >= cost:
+        return True, tokens - cost, 0.0
+    return False, tokens, (cost - tokens) / rate if rate > 0 else math.inf
+
+
+class MemoryBucketStore(BucketStore):
+    """Per-process buckets; limits multiply by the number of workers."""
+
+    def __init__(self, maxsize: int = 65536):
+        self.maxsize = maxsize
+        self._buckets: "OrderedDict[str, tuple[float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def take(self, key, capacity, rate, cost=1.0):
+        now = time.time()
+        with self._lock:
+            tokens, updated = self._buckets.get(key, (capacity, now))
+            allowed, left, retry_after = _spend(
+                _refill(tokens, updated, now, capacity, rate), capacity, rate, cost
+            )
+            self._buckets[key] = (left, now)
+            self._buckets.move_to_end(key)
+            if len(self._buckets) > self.maxsize:
+                self._buckets.popitem(last=False)
+        return allowed, left, retry_after
+
+
+class FileBucketStore(BucketStore):
+    """Buckets in a memory-mapped file shared by every worker on the host.
+
+    The file is a fixed hash table of 32-byte slots (key hash, tokens, last
+    update). A key probes at most ``PROBE`` consecutive slots, locked together
+    with one ``fcntl`` byte-range lock, so each check is O(1) and workers only
+    contend when they hit the same slots. When every probed slot belongs to
+    another key, the least recently used one is taken over; that bucket then
+    starts full again, so a collision can only make a limit more lenient.
+    """
+
+    SLOT = struct.Struct("<Qdd8x")
+    PROBE = 4
+
+    def __init__(self, path: str, slots: int = 65536):
+        self.path = path
+        self.slots = slots
+        size = (slots + self.PROBE) * self.SLOT.size
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        if os.fstat(self._fd).st_size < size:
+            os.ftruncate(self._fd, size)
+        self._map = mmap.mmap(self._fd, size)
+        # fcntl locks are per process; this serialises threads within one.
+        self._lock = threading.Lock()
+
+    def _key_hash(self, key: str) -> int:
+        # 0 marks an empty slot.
+        return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "little") or 1
+
+    def take(self, key, capacity, rate, cost=1.0):
+        key_hash = self._key_hash(key)
+        first = key_hash % self.slots
+        start = first * self.SLOT.size
+        length = self.PROBE * self.SLOT.size
+        now = time.time()
+
+        with self._lock:
+            fcntl.lockf(self._fd, fcntl.LOCK_EX, length, start)
+            try:
+                victim, victim_updated = start, math.inf
+                tokens, updated = capacity, now
+                for offset in range(start, start + length, self.SLOT.size):
+                    slot_hash, slot_tokens, slot_updated = self.SLOT.unpack_from(self._map, offset)
+                    if slot_hash == key_hash:
+                        victim, tokens, updated = offset, slot_tokens, slot_updated
+                        break
+                    if slot_hash == 0:
+                        victim, victim_updated = offset, -math.inf
+                    elif slot_updated < victim_updated:
+                        victim, victim_updated = offset, slot_updated
+
+                allowed, left, retry_after = _spend(
+                    _refill(tokens, updated, now, capacity, rate), capacity, rate, cost
+                )
+                self.SLOT.pack_into(self._map, victim, key_hash, left, now)
+            finally:
+                fcntl.lockf(self._fd, fcntl.LOCK_UN, length, start)
+        return allowed, left, retry_after
+
+
+def create_bucket_store(backend: str) -> BucketStore:
+    """``"memory"``, ``"file"`` or a ``"module:factory"`` path returning a ``BucketStore``."""
+    if backend == "memory":
+        return MemoryBucketStore()
+    if backend == "file":
+        path = settings.RATE_LIMIT_FILE or os.path.join(
+            tempfile.gettempdir(), "task-manager-ratelimit.bin"
+        )
+        return FileBucketStore(path, slots=settings.RATE_LIMIT_SLOTS)
+    module_name, _, attr = backend.partition(":")
+    return getattr(import_module(module_name), attr)()
+
+
+def client_identity(request: Request) -> str:
+    """Bucket owner: the authenticated user if the bearer token verifies, else the client IP."""
+    authorization = request.headers.get("authorization", "")
+    if authorization[:7].lower() == "bearer ":
+        payload = decode_token(authorization[7:])
+        if payload and payload.get("sub"):
+            return "user:" + payload["sub"]
+    return "ip:" + (request.client.host if request.client else "127.0.0.1")
+
+
+class RateLimiter:
+    """Per-route limits plus one shared, cost-weighted budget per client.
+
+    ``limit`` gives a route its own bucket. ``charge`` spends from a single
+    per-client budget (``budget`` units, e.g. ``"600/minute"``) that all
+    expensive routes draw on, so a caller can run many cheap calls or a few
+    heavy ones but not starve the database with heavy ones. Either way the
+    response carries ``X-RateLimit-*`` headers describing the bucket, and a
+    refusal is a 429 with ``Retry-After``.
+    """
+
+    def __init__(
+        self,
+        store: BucketStore,
+        budget: str = "600/minute",
+        key_func: Callable[[Request], str] = client_identity,
+    ):
+        self.store = store
+        self.key_func = key_func
+        self.budget_capacity, self.budget_rate = parse_rate(budget)
+
+    def hit(
+        self, request: Request, scope: str, capacity: float, rate: float, cost: float = 1.0
+    ) -> Dict[str, str]:
+        """Spend ``cost`` from the client's ``scope`` bucket and return its headers."""
+        allowed, left, retry_after = self.store.take(
+            f"{scope}:{self.key_func(request)}", capacity, rate, cost
+        )
+        headers = {
+            "X-RateLimit-Limit": f"{capacity:g}",
+            "X-RateLimit-Remaining": str(int(left)),
+            "X-RateLimit-Reset": str(math.ceil((capacity - left) / rate)) if rate else "0",
+            "X-RateLimit-Cost": f"{cost:g}",
+        }
+        if not allowed:
+            raise RateLimitedException(retry_after=max(1, math.ceil(retry_after)), headers=headers)
+        return headers
+
+    def _guard(self, scope: Optional[str], capacity: float, rate: float, cost: float):
+        def decorator(func):
+            bucket = scope or f"{func.__module__}.{func.__name__}"
+
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                headers = self.hit(kwargs["request"], bucket, capacity, rate, cost)
+                response = await func(*args, **kwargs)
+                response.headers.update(headers)
+                return response
+
+            return wrapper
+
+        return decorator
+
+    def limit(self, spec: str, cost: float = 1.0):
+        """Limit a route to ``spec`` (e.g. ``"5/minute"``) per client.
+
+        The endpoint must take a ``request: Request`` argument and return a
+        ``Response``.
+        """
+        capacity, rate = parse_rate(spec)
+        return self._guard(None, capacity, rate, cost)
+
+    def charge(self, cost: float):
+        """Charge each call ``cost`` units of the client's shared budget."""
+        return self._guard("budget", self.budget_capacity, self.budget_rate, cost)
+
+
+limiter = RateLimiter(
+    create_bucket_store(settings.RATE_LIMIT_BACKEND), budget=settings.RATE_LIMIT_BUDGET
+)
@@ -1,10 +1,16 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Any, Callable, Dict, Optional
 
 from jose import jwt, JWTError
 from passlib.context import CryptContext
 
 from app.core.config import get_settings
+from app.utils.exceptions import ServiceUnavailableException
 
 settings = get_settings()
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -18,6 +24,93 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+def _percentile(samples: list, q: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class PasswordPool:
+    """Runs bcrypt off the event loop on a fixed number of threads.
+
+    bcrypt releases the GIL, so threads give real parallelism without the
+    pickling cost of a process pool. Work beyond ``max_pending`` (queued plus
+    running) is rejected straight away with a 503 instead of piling up
+    behind a login burst.
+    """
+
+    def __init__(self, workers: int, max_pending: int, window: int = 1024):
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bcrypt")
+        self._lock = threading.Lock()
+        self._wait = deque(maxlen=window)
+        self._run = deque(maxlen=window)
+        # Only touched from the event loop thread.
+        self.pending = 0
+        self.completed = 0
+        self.rejected = 0
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise ServiceUnavailableException("Too many sign-in attempts in progress, retry shortly")
+
+        queued_at = time.perf_counter()
+
+        def timed():
+            started = time.perf_counter()
+            try:
+                return fn(*args)
+            finally:
+                with self._lock:
+                    self._wait.append(started - queued_at)
+                    self._run.append(time.perf_counter() - started)
+
+        self.pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, timed)
+        finally:
+            self.pending -= 1
+            self.completed += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            wait, run = list(self._wait), list(self._run)
+        return {
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "pending": self.pending,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "wait_ms": {
+                "p50": round(_percentile(wait, 0.50) * 1000, 2),
+                "p99": round(_percentile(wait, 0.99) * 1000, 2),
+                "max": round(max(wait, default=0.0) * 1000, 2),
+            },
+            "run_ms": {
+                "p50": round(_percentile(run, 0.50) * 1000, 2),
+                "p99": round(_percentile(run, 0.99) * 1000, 2),
+                "max": round(max(run, default=0.0) * 1000, 2),
+            },
+        }
+
+
+password_pool = PasswordPool(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+)
+
+
+async def hash_password_async(password: str) -> str:
+    return await password_pool.run(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await password_pool.run(verify_password, plain_password, hashed_password)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     to_encode = data.copy()
     expire = datetime.now(timezone.utc) + (
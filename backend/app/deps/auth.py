@@ -1,32 +1,116 @@
+import uuid
+
 from fastapi import Depends
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session, object_session
 
+from app.core.cache import create_cache
+from app.core.config import get_settings
 from app.core.security import decode_token
 from app.core.database import get_db
 from app.models.user import User
+from app.services import token_service
 from app.utils.exceptions import UnauthorizedException
 
+settings = get_settings()
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
+# Snapshots of resolved users keyed by (user id, access token). The token is
+# still verified on every request, so expiry is enforced; the cache only saves
+# the users lookup. Plain tuples are cached, never the ORM instance, which
+# belongs to the session that loaded it.
+_PRINCIPAL_FIELDS = ("id", "name", "email", "avatar", "created_at", "updated_at")
 
-async def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: AsyncSession = Depends(get_db),
-) -> User:
+_principal_cache = create_cache(
+    "principals", maxsize=settings.PRINCIPAL_CACHE_SIZE, ttl=settings.PRINCIPAL_CACHE_TTL
+)
+
+
+def invalidate_principal(user_id: uuid.UUID) -> None:
+    """Drop every cached principal for ``user_id``."""
+    user_key = str(user_id)
+    for key in _principal_cache.keys():
+        if key[0] == user_key:
+            _principal_cache.delete(key)
+
+
+# session.info key for users whose cached principals go stale on commit.
+_PENDING_INVALIDATION = "principal_user_ids"
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _user_changed(mapper, connection, target: User) -> None:
+    # Flushed but not committed: dropping the entry now would let a concurrent
+    # request cache the old row again, so it waits for the commit.
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(_PENDING_INVALIDATION, set()).add(target.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session: Session) -> None:
+    for user_id in session.info.pop(_PENDING_INVALIDATION, ()):
+        invalidate_principal(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back(session: Session) -> None:
+    session.info.pop(_PENDING_INVALIDATION, None)
+
+
+def _verified_claims(token: str) -> dict:
     payload = decode_token(token)
     if payload is None:
         raise UnauthorizedException("Invalid or expired token")
 
-    user_id = payload.get("sub")
-    if user_id is None:
+    if payload.get("sub") is None:
         raise UnauthorizedException("Invalid token payload")
 
+    if token_service.is_revoked(payload["sub"], payload.get("ep", 0)):
+        raise UnauthorizedException("Token has been revoked")
+
+    return payload
+
+
+async def _load_user(db: AsyncSession, user_id: str, token: str) -> User:
+    cache_key = (user_id, token)
+    snapshot = _principal_cache.get(cache_key)
+    if snapshot is not None:
+        # A transient User, like the STATELESS_AUTH principal below.
+        return User(**dict(zip(_PRINCIPAL_FIELDS, snapshot)))
+
     result = await db.execute(select(User).where(User.id == user_id))
     user = result.scalar_one_or_none()
 
     if user is None:
         raise UnauthorizedException("User not found")
 
+    _principal_cache.set(cache_key, tuple(getattr(user, f) for f in _PRINCIPAL_FIELDS))
     return user
+
+
+async def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_db),
+) -> User:
+    payload = _verified_claims(token)
+
+    # With STATELESS_AUTH, tokens carry the identity routers use, so the
+    # principal is built without touching the database. The result is a
+    # transient User holding only id, name and email.
+    if settings.STATELESS_AUTH and "email" in payload:
+        return User(id=uuid.UUID(payload["sub"]), name=payload["name"], email=payload["email"])
+
+    return await _load_user(db, payload["sub"], token)
+
+
+async def get_current_user_record(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_db),
+) -> User:
+    """The authenticated user's full row, for routes needing more than the token claims."""
+    payload = _verified_claims(token)
+    return await _load_user(db, payload["sub"], token)
@@ -1,17 +1,22 @@
+import asyncio
 from contextlib import asynccontextmanager
 import logging
 import os
 
-from fastapi import FastAPI, Request
+from fastapi import Depends, FastAPI, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
-from slowapi.errors import RateLimitExceeded
 
+from app.core.cache import cache_stats
 from app.core.config import get_settings
 from app.core.middleware import SecurityHeadersMiddleware
-from app.core.rate_limiter import limiter
+from app.core.security import password_pool
+from app.deps.auth import get_current_user
+from app.models.user import User
 from app.routers import auth, tasks, comments, files, analytics
+from app.services.export_service import run_export_reaper
+from app.services.token_service import run_epoch_refresher
 from app.utils.exceptions import AppException
 
 logger = logging.getLogger(__name__)
@@ -21,7 +26,11 @@ settings = get_settings()
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
+    refresher = asyncio.create_task(run_epoch_refresher(settings.TOKEN_EPOCH_REFRESH_SECONDS))
+    reaper = asyncio.create_task(run_export_reaper(settings.EXPORT_JOB_REAP_SECONDS))
     yield
+    refresher.cancel()
+    reaper.cancel()
 
 
 app = FastAPI(
@@ -34,8 +43,6 @@ app = FastAPI(
     redoc_url="/redoc",
 )
 
-app.state.limiter = limiter
-
 app.add_middleware(SecurityHeadersMiddleware)
 app.add_middleware(
     CORSMiddleware,
@@ -43,23 +50,18 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[
+        "Retry-After",
+        "X-RateLimit-Limit",
+        "X-RateLimit-Remaining",
+        "X-RateLimit-Reset",
+        "X-RateLimit-Cost",
+        "Accept-Ranges",
+        "Content-Range",
+    ],
 )
 
 
-@app.exception_handler(RateLimitExceeded)
-async def rate_limit_handler(request: Request, exc: RateLimitExceeded):
-    return JSONResponse(
-        status_code=429,
-        content={
-            "success": False,
-            "error": {
-                "message": "Too many requests. Please try again later.",
-                "code": "RATE_LIMITED",
-            },
-        },
-    )
-
-
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     errors = exc.errors()
@@ -93,6 +95,7 @@ async def app_exception_handler(request: Request, exc: AppException):
                 "code": exc.code,
             },
         },
+        headers=exc.headers,
     )
 
 
@@ -121,3 +124,13 @@ app.include_router(analytics.router)
 @app.get("/api/health")
 async def health_check():
     return {"success": True, "message": "API is running"}
+
+
+@app.get("/api/health/cache")
+async def cache_health(current_user: User = Depends(get_current_user)):
+    return {"success": True, "data": cache_stats()}
+
+
+@app.get("/api/health/password-pool")
+async def password_pool_health(current_user: User = Depends(get_current_user)):
+    return {"success": True, "data": password_pool.stats()}
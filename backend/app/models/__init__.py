@@ -2,5 +2,18 @@ from app.models.user import User
 from app.models.task import Task
 from app.models.comment import Comment
 from app.models.file import File
+from app.models.token_epoch import UserTokenEpoch
+from app.models.task_hourly_stat import TaskHourlyStat
+from app.models.task_status_event import TaskStatusEvent
+from app.models.export_job import ExportJob
 
-__all__ = ["User", "Task", "Comment", "File"]
+__all__ = [
+    "User",
+    "Task",
+    "Comment",
+    "File",
+    "UserTokenEpoch",
+    "TaskHourlyStat",
+    "TaskStatusEvent",
+    "ExportJob",
+]
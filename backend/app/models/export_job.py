@@ -0,0 +1,55 @@
+import enum
+import uuid
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlalchemy import BigInteger, DateTime, Enum, ForeignKey, Integer, String, Text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class ExportJobStatus(str, enum.Enum):
+    PENDING = "PENDING"
+    RUNNING = "RUNNING"
+    COMPLETED = "COMPLETED"
+    FAILED = "FAILED"
+
+
+class ExportJob(Base):
+    """A task export written to a file in the background.
+
+    ``rows_written`` out of ``total_rows`` is the progress, and the runner
+    bumps ``heartbeat_at`` with every batch. ``expires_at`` is set once the
+    job completes or fails; the row and its file are removed after that.
+    """
+
+    __tablename__ = "export_jobs"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    format: Mapped[str] = mapped_column(String(10), nullable=False)
+    compression: Mapped[Optional[str]] = mapped_column(String(10), nullable=True)
+    assigned_to: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), nullable=True)
+    status: Mapped[ExportJobStatus] = mapped_column(
+        Enum(ExportJobStatus), default=ExportJobStatus.PENDING, nullable=False
+    )
+    total_rows: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    rows_written: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    size: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
+    error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+    )
+    heartbeat_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+    )
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    expires_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True, index=True
+    )
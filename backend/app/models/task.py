@@ -3,8 +3,8 @@ import enum
 from datetime import datetime, timezone
 from typing import Optional, List, TYPE_CHECKING
 
-from sqlalchemy import String, Text, DateTime, Boolean, ForeignKey, Enum
-from sqlalchemy.dialects.postgresql import UUID, ARRAY
+from sqlalchemy import String, Text, DateTime, Boolean, ForeignKey, Enum, Index, Computed, text
+from sqlalchemy.dialects.postgresql import UUID, ARRAY, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -27,8 +27,53 @@ class TaskPriority(str, enum.Enum):
     HIGH = "HIGH"
 
 
+LIVE_TASKS = text("is_deleted = false")
+LIVE_COMPLETED_TASKS = text("is_deleted = false AND completed_at IS NOT NULL")
+
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B')"
+)
+
+
 class Task(Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        Index("ix_tasks_live_created_at", "created_at", "id", postgresql_where=LIVE_TASKS),
+        Index("ix_tasks_live_updated_at", "updated_at", "id", postgresql_where=LIVE_TASKS),
+        Index("ix_tasks_live_due_date", "due_date", "id", postgresql_where=LIVE_TASKS),
+        Index("ix_tasks_live_title", "title", "id", postgresql_where=LIVE_TASKS),
+        Index("ix_tasks_live_status", "status", "created_at", postgresql_where=LIVE_TASKS),
+        Index("ix_tasks_live_priority", "priority", "created_at", postgresql_where=LIVE_TASKS),
+        Index("ix_tasks_live_assigned_to", "assigned_to", "status", postgresql_where=LIVE_TASKS),
+        Index(
+            "ix_tasks_live_completed_at",
+            "assigned_to",
+            "completed_at",
+            postgresql_where=LIVE_COMPLETED_TASKS,
+        ),
+        Index("ix_tasks_live_tags", "tags", postgresql_using="gin", postgresql_where=LIVE_TASKS),
+        Index(
+            "ix_tasks_live_search_vector",
+            "search_vector",
+            postgresql_using="gin",
+            postgresql_where=LIVE_TASKS,
+        ),
+        Index(
+            "ix_tasks_live_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+            postgresql_where=LIVE_TASKS,
+        ),
+        Index(
+            "ix_tasks_live_description_trgm",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+            postgresql_where=LIVE_TASKS,
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
@@ -51,6 +96,8 @@ class Task(Base):
     )
     is_deleted: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     deleted_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    # Set when the task moves to DONE, cleared if it is reopened.
+    completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
     )
@@ -59,6 +106,9 @@ class Task(Base):
         default=lambda: datetime.now(timezone.utc),
         onupdate=lambda: datetime.now(timezone.utc),
     )
+    search_vector: Mapped[Optional[str]] = mapped_column(
+        TSVECTOR, Computed(SEARCH_VECTOR_SQL, persisted=True), deferred=True
+    )
 
     creator: Mapped["User"] = relationship(
         back_populates="created_tasks", foreign_keys=[created_by]
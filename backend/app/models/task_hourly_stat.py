@@ -0,0 +1,28 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, Index
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+# Stands in for "no assignee" so it can be part of the primary key.
+UNASSIGNED = uuid.UUID(int=0)
+
+
+class TaskHourlyStat(Base):
+    """Per-hour, per-assignee task counts, kept in step with task writes.
+
+    ``created`` counts live tasks created in the hour starting at ``hour``;
+    ``completed`` counts live tasks completed (``completed_at``) in it. Hours
+    are UTC, so days in any zone with a whole-hour offset are sums of them.
+    """
+
+    __tablename__ = "task_hourly_stats"
+    __table_args__ = (Index("ix_task_hourly_stats_assignee_id_hour", "assignee_id", "hour"),)
+
+    hour: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
+    assignee_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    created: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    completed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
@@ -0,0 +1,50 @@
+import uuid
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+from app.models.task import TaskStatus
+
+
+class TaskStatusEvent(Base):
+    """Append-only log of task status transitions.
+
+    ``from_status`` is null for the status a task was created with.
+    ``assignee_id`` is the assignee at the time of the transition, so
+    per-user completion metrics don't move when a task is reassigned later.
+    """
+
+    __tablename__ = "task_status_events"
+    __table_args__ = (
+        Index("ix_task_status_events_task_id_to_status", "task_id", "to_status", "created_at"),
+        Index(
+            "ix_task_status_events_completed",
+            "created_at",
+            "assignee_id",
+            postgresql_where=text("to_status = 'DONE'"),
+        ),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    task_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False
+    )
+    from_status: Mapped[Optional[TaskStatus]] = mapped_column(
+        Enum(TaskStatus, create_type=False), nullable=True
+    )
+    to_status: Mapped[TaskStatus] = mapped_column(
+        Enum(TaskStatus, create_type=False), nullable=False
+    )
+    assignee_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), nullable=True)
+    changed_by: Mapped[Optional[uuid.UUID]] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("users.id"), nullable=True
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+    )
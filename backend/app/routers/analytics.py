@@ -1,59 +1,160 @@
 import uuid
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Query
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, BackgroundTasks, Depends, Query, Request
+from fastapi.responses import FileResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.rate_limiter import limiter
 from app.deps.auth import get_current_user
 from app.deps.database import get_db
 from app.models.user import User
-from app.services import analytics_service
-from app.utils.response import success_response
+from app.schemas.export import ExportJobResponse
+from app.services import analytics_service, export_service
+from app.utils.response import cached_response, success_response
 
 router = APIRouter(prefix="/api/analytics", tags=["Analytics"])
 
 
 @router.get("/overview", response_model=None)
+@limiter.charge(10)
 async def get_overview(
+    request: Request,
     assigned_to: Optional[uuid.UUID] = Query(None),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    data = await analytics_service.get_overview(db, assigned_to=assigned_to)
-    return success_response(data)
+    data, meta = await analytics_service.cached(
+        db, analytics_service.get_overview, assigned_to=assigned_to
+    )
+    return cached_response(data, meta)
+
+
+@router.get("/dashboard", response_model=None)
+@limiter.charge(10)
+async def get_dashboard(
+    request: Request,
+    assigned_to: Optional[uuid.UUID] = Query(None),
+    days: int = Query(30, ge=7, le=365),
+    granularity: str = Query("day", pattern="^(day|week|month)$"),
+    tz: str = Query("UTC", max_length=64),
+    sections: Optional[str] = Query(None, max_length=100),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    requested = (
+        tuple(sorted({s.strip() for s in sections.split(",") if s.strip()}))
+        if sections
+        else analytics_service.DASHBOARD_SECTIONS
+    )
+    data, meta = await analytics_service.cached(
+        db,
+        analytics_service.get_dashboard,
+        assigned_to=assigned_to,
+        days=days,
+        granularity=granularity,
+        tz=tz,
+        sections=requested,
+    )
+    return cached_response(data, meta)
 
 
 @router.get("/performance", response_model=None)
+@limiter.charge(10)
 async def get_performance(
+    request: Request,
     assigned_to: Optional[uuid.UUID] = Query(None),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    data = await analytics_service.get_performance(db, assigned_to=assigned_to)
-    return success_response(data)
+    data, meta = await analytics_service.cached(
+        db, analytics_service.get_performance, assigned_to=assigned_to
+    )
+    return cached_response(data, meta)
 
 
 @router.get("/trends", response_model=None)
+@limiter.charge(10)
 async def get_trends(
+    request: Request,
     days: int = Query(30, ge=7, le=365),
     assigned_to: Optional[uuid.UUID] = Query(None),
+    granularity: str = Query("day", pattern="^(day|week|month)$"),
+    tz: str = Query("UTC", max_length=64),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    data = await analytics_service.get_trends(db, days=days, assigned_to=assigned_to)
-    return success_response(data)
+    data, meta = await analytics_service.cached(
+        db,
+        analytics_service.get_trends,
+        days=days,
+        assigned_to=assigned_to,
+        granularity=granularity,
+        tz=tz,
+    )
+    return cached_response(data, meta)
 
 
 @router.get("/export", response_model=None)
-async def export_csv(
+@limiter.charge(100)
+async def export_tasks(
+    request: Request,
     assigned_to: Optional[uuid.UUID] = Query(None),
+    format: str = Query("csv", pattern="^(csv|ndjson)$"),
+    compression: Optional[str] = Query(None, pattern="^gzip$"),
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
 ):
-    csv_content = await analytics_service.export_tasks_csv(db, assigned_to=assigned_to)
+    filename = export_service.file_name(format, compression)
     return StreamingResponse(
-        iter([csv_content]),
-        media_type="text/csv",
-        headers={"Content-Disposition": "attachment; filename=tasks_export.csv"},
+        analytics_service.stream_tasks_export(
+            assigned_to=assigned_to, format=format, compression=compression
+        ),
+        media_type=export_service.media_type(format, compression),
+        headers={"Content-Disposition": f"attachment; filename={filename}"},
+    )
+
+
+@router.post("/exports", response_model=None, status_code=202)
+@limiter.charge(100)
+async def create_export_job(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    assigned_to: Optional[uuid.UUID] = Query(None),
+    format: str = Query("csv", pattern="^(csv|ndjson)$"),
+    compression: Optional[str] = Query(None, pattern="^gzip$"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    job = await export_service.create_job(
+        db, current_user.id, assigned_to=assigned_to, format=format, compression=compression
+    )
+    background_tasks.add_task(export_service.run_job, job.id)
+    response = success_response(job, ExportJobResponse)
+    response.status_code = 202
+    return response
+
+
+@router.get("/exports/{job_id}", response_model=None)
+async def get_export_job(
+    job_id: uuid.UUID,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    job = await export_service.get_job(db, job_id, current_user.id)
+    return success_response(job, ExportJobResponse)
+
+
+@router.get("/exports/{job_id}/download", response_class=FileResponse)
+async def download_export_job(
+    job_id: uuid.UUID,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    job = await export_service.get_download(db, job_id, current_user.id)
+    # FileResponse answers Range / If-Range requests, so interrupted
+    # downloads resume where they stopped.
+    return FileResponse(
+        path=export_service.job_path(job.id),
+        filename=export_service.file_name(job.format, job.compression),
+        media_type=export_service.media_type(job.format, job.compression),
     )
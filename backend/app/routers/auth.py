@@ -4,11 +4,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.rate_limiter import limiter
 from app.deps.database import get_db
-from app.deps.auth import get_current_user
+from app.deps.auth import get_current_user, get_current_user_record
 from app.models.user import User
 from app.schemas.user import UserRegister, UserResponse, TokenResponse
+from app.services import token_service
 from app.services.auth_service import register_user, authenticate_user, generate_tokens
-from app.utils.response import success_response
+from app.utils.response import success_response, message_response
 
 router = APIRouter(prefix="/api/auth", tags=["Authentication"])
 
@@ -18,7 +19,7 @@ router = APIRouter(prefix="/api/auth", tags=["Authentication"])
 async def register(request: Request, data: UserRegister, db: AsyncSession = Depends(get_db)):
     user = await register_user(db, data)
     tokens = generate_tokens(user)
-    return success_response(TokenResponse(**tokens).model_dump())
+    return success_response(tokens, TokenResponse)
 
 
 @router.post("/login", response_model=None)
@@ -29,10 +30,19 @@ async def login(
     db: AsyncSession = Depends(get_db),
 ):
     user = await authenticate_user(db, form_data.username, form_data.password)
-    tokens = generate_tokens(user)
-    return success_response(TokenResponse(**tokens).model_dump())
+    tokens = generate_tokens(user, await token_service.user_epoch(db, user.id))
+    return success_response(tokens, TokenResponse)
 
 
 @router.get("/me", response_model=None)
-async def get_me(current_user: User = Depends(get_current_user)):
-    return success_response(UserResponse.model_validate(current_user).model_dump())
+async def get_me(current_user: User = Depends(get_current_user_record)):
+    return success_response(current_user, UserResponse)
+
+
+@router.post("/revoke", response_model=None)
+async def revoke_tokens(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    await token_service.revoke_user_tokens(db, current_user.id)
+    return message_response("All access tokens have been revoked")
@@ -1,6 +1,7 @@
 import uuid
+from typing import Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.deps.auth import get_current_user
@@ -8,6 +9,7 @@ from app.deps.database import get_db
 from app.models.user import User
 from app.schemas.comment import CommentCreate, CommentUpdate, CommentResponse
 from app.services import comment_service
+from app.utils.etag import make_etag, etag_matches, with_etag, not_modified
 from app.utils.response import success_response, message_response
 
 router = APIRouter(prefix="/api/tasks/{task_id}/comments", tags=["Comments"])
@@ -21,19 +23,23 @@ async def add_comment(
     db: AsyncSession = Depends(get_db),
 ):
     comment = await comment_service.create_comment(db, task_id, data, current_user.id)
-    return success_response(CommentResponse.model_validate(comment).model_dump(mode="json"))
+    return success_response(comment, CommentResponse)
 
 
 @router.get("/", response_model=None)
 async def list_comments(
     task_id: uuid.UUID,
+    if_none_match: Optional[str] = Header(None),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
+    version = await comment_service.comments_version(db, task_id)
+    etag = make_etag("comments", task_id, version)
+    if version is not None and etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
     comments = await comment_service.list_comments(db, task_id)
-    return success_response(
-        [CommentResponse.model_validate(c).model_dump(mode="json") for c in comments]
-    )
+    return with_etag(success_response(comments, list[CommentResponse]), etag)
 
 
 @router.put("/{comment_id}", response_model=None)
@@ -47,7 +53,7 @@ async def update_comment(
     comment = await comment_service.update_comment(
         db, task_id, comment_id, data, current_user.id
     )
-    return success_response(CommentResponse.model_validate(comment).model_dump(mode="json"))
+    return success_response(comment, CommentResponse)
 
 
 @router.delete("/{comment_id}", response_model=None)
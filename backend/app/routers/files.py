@@ -2,11 +2,12 @@ import os
 import uuid
 from typing import List
 
-from fastapi import APIRouter, Depends, UploadFile, File as FastAPIFile
+from fastapi import APIRouter, Depends, Request, UploadFile, File as FastAPIFile
 from fastapi.responses import FileResponse as FastAPIFileResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import get_settings
+from app.core.rate_limiter import limiter
 from app.deps.auth import get_current_user
 from app.deps.database import get_db
 from app.models.user import User
@@ -20,16 +21,16 @@ router = APIRouter(prefix="/api/tasks/{task_id}/files", tags=["Files"])
 
 
 @router.post("/", response_model=None)
+@limiter.charge(10)
 async def upload_files(
+    request: Request,
     task_id: uuid.UUID,
     files: List[UploadFile] = FastAPIFile(...),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     saved = await file_service.upload_files(db, task_id, files, current_user.id)
-    return success_response(
-        [FileResponse.model_validate(f).model_dump(mode="json") for f in saved]
-    )
+    return success_response(saved, list[FileResponse])
 
 
 @router.get("/{file_id}", response_class=FastAPIFileResponse)
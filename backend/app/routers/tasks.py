@@ -1,9 +1,10 @@
 import uuid
 from typing import Optional, List
 
-from fastapi import APIRouter, Depends, Query, BackgroundTasks
+from fastapi import APIRouter, Depends, Header, Query, Request, BackgroundTasks
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.rate_limiter import limiter
 from app.deps.auth import get_current_user
 from app.deps.database import get_db
 from app.models.user import User
@@ -11,21 +12,27 @@ from app.schemas.task import TaskCreate, TaskUpdate, TaskResponse, TaskDetailRes
 from app.schemas.user import UserResponse
 from app.services import task_service
 from app.services.email_service import send_task_assignment_email
-from app.utils.response import success_response, paginated_response, message_response
+from app.utils.etag import conditional, make_etag, etag_matches, with_etag, not_modified
+from app.utils.response import (
+    success_response,
+    paginated_response,
+    cursor_paginated_response,
+    message_response,
+)
 
 router = APIRouter(prefix="/api/tasks", tags=["Tasks"])
 
 
 @router.post("/bulk", response_model=None)
+@limiter.charge(20)
 async def bulk_create_tasks(
+    request: Request,
     tasks: List[TaskCreate],
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     created = await task_service.bulk_create_tasks(db, tasks, current_user.id)
-    return success_response(
-        [TaskResponse.model_validate(t).model_dump(mode="json") for t in created]
-    )
+    return success_response(created, list[TaskResponse])
 
 
 @router.post("/", response_model=None)
@@ -46,7 +53,7 @@ async def create_task(
             assigner_name=current_user.name,
         )
 
-    return success_response(TaskResponse.model_validate(task).model_dump(mode="json"))
+    return success_response(task, TaskResponse)
 
 
 @router.get("/", response_model=None)
@@ -54,16 +61,53 @@ async def list_tasks(
     status: Optional[str] = Query(None, pattern="^(TODO|IN_PROGRESS|DONE)$"),
     priority: Optional[str] = Query(None, pattern="^(LOW|MEDIUM|HIGH)$"),
     search: Optional[str] = Query(None, max_length=200),
-    sort_by: str = Query("created_at", pattern="^(created_at|updated_at|title|status|priority|due_date)$"),
+    sort_by: str = Query(
+        "created_at",
+        pattern="^(created_at|updated_at|title|status|priority|due_date|relevance)$",
+    ),
     order: str = Query("desc", pattern="^(asc|desc)$"),
     page: int = Query(1, ge=1),
     limit: int = Query(10, ge=1, le=100),
+    pagination: str = Query("offset", pattern="^(offset|cursor)$"),
+    cursor: Optional[str] = Query(None, max_length=1000),
+    count: str = Query("exact", pattern="^(exact|estimated|cached)$"),
+    fields: Optional[str] = Query(None, max_length=500),
     tags: Optional[str] = Query(None),
     assigned_to: Optional[uuid.UUID] = Query(None),
+    if_none_match: Optional[str] = Header(None),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     tags_list = [t.strip() for t in tags.split(",")] if tags else None
+    fields_list = [f.strip() for f in fields.split(",") if f.strip()] if fields else None
+
+    if pagination == "cursor" or cursor:
+        tasks, total, next_cursor, prev_cursor = await task_service.list_tasks_keyset(
+            db,
+            status=status,
+            priority=priority,
+            search=search,
+            sort_by=sort_by,
+            order=order,
+            limit=limit,
+            cursor=cursor,
+            tags=tags_list,
+            assigned_to=assigned_to,
+            count_strategy=count,
+            fields=fields_list,
+        )
+        return conditional(
+            cursor_paginated_response(
+                data=tasks,
+                total=total,
+                limit=limit,
+                next_cursor=next_cursor,
+                prev_cursor=prev_cursor,
+                count_strategy=count,
+            ),
+            if_none_match,
+        )
+
     tasks, total = await task_service.list_tasks(
         db,
         status=status,
@@ -75,12 +119,18 @@ async def list_tasks(
         limit=limit,
         tags=tags_list,
         assigned_to=assigned_to,
+        count_strategy=count,
+        fields=fields_list,
     )
-    return paginated_response(
-        data=[TaskResponse.model_validate(t).model_dump(mode="json") for t in tasks],
-        total=total,
-        page=page,
-        limit=limit,
+    return conditional(
+        paginated_response(
+            data=tasks,
+            total=total,
+            page=page,
+            limit=limit,
+            count_strategy=count,
+        ),
+        if_none_match,
     )
 
 
@@ -90,19 +140,23 @@ async def list_users(
     db: AsyncSession = Depends(get_db),
 ):
     users = await task_service.get_all_users(db)
-    return success_response(
-        [UserResponse.model_validate(u).model_dump(mode="json") for u in users]
-    )
+    return success_response(users, list[UserResponse])
 
 
 @router.get("/{task_id}", response_model=None)
 async def get_task(
     task_id: uuid.UUID,
+    if_none_match: Optional[str] = Header(None),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
+    version = await task_service.task_version(db, task_id)
+    etag = make_etag("task", task_id, version)
+    if version is not None and etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
     task = await task_service.get_task(db, task_id)
-    return success_response(TaskDetailResponse.model_validate(task).model_dump(mode="json"))
+    return with_etag(success_response(task, TaskDetailResponse), etag)
 
 
 @router.put("/{task_id}", response_model=None)
@@ -131,7 +185,7 @@ async def update_task(
             assigner_name=current_user.name,
         )
 
-    return success_response(TaskResponse.model_validate(task).model_dump(mode="json"))
+    return success_response(task, TaskResponse)
 
 
 @router.delete("/{task_id}", response_model=None)
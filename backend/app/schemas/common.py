@@ -1,4 +1,5 @@
-from typing import Any, Generic, TypeVar
+from datetime import datetime
+from typing import Any, Generic, Optional, TypeVar
 from pydantic import BaseModel
 
 T = TypeVar("T")
@@ -9,6 +10,21 @@ class PaginationMeta(BaseModel):
     limit: int
     total: int
     total_pages: int
+    count_strategy: str = "exact"
+
+
+class CursorPaginationMeta(BaseModel):
+    limit: int
+    total: int
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+    count_strategy: str = "exact"
+
+
+class CacheMeta(BaseModel):
+    computed_at: datetime
+    age_seconds: float
+    stale: bool = False
 
 
 class SuccessResponse(BaseModel, Generic[T]):
@@ -22,6 +38,18 @@ class PaginatedResponse(BaseModel, Generic[T]):
     meta: PaginationMeta
 
 
+class CursorPaginatedResponse(BaseModel, Generic[T]):
+    success: bool = True
+    data: list[T]
+    meta: CursorPaginationMeta
+
+
+class CachedResponse(BaseModel, Generic[T]):
+    success: bool = True
+    data: T
+    meta: CacheMeta
+
+
 class ErrorDetail(BaseModel):
     message: str
     code: str
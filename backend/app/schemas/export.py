@@ -0,0 +1,34 @@
+import uuid
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, computed_field
+
+from app.models.export_job import ExportJobStatus
+
+
+class ExportJobResponse(BaseModel):
+    id: uuid.UUID
+    format: str
+    compression: Optional[str] = None
+    assigned_to: Optional[uuid.UUID] = None
+    status: ExportJobStatus
+    total_rows: Optional[int] = None
+    rows_written: int
+    size: Optional[int] = None
+    error: Optional[str] = None
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+    expires_at: Optional[datetime] = None
+
+    model_config = {"from_attributes": True}
+
+    @computed_field
+    @property
+    def progress(self) -> float:
+        """Fraction of rows written, 0.0–1.0."""
+        if self.status == ExportJobStatus.COMPLETED:
+            return 1.0
+        if not self.total_rows:
+            return 0.0
+        return round(min(1.0, self.rows_written / self.total_rows), 4)
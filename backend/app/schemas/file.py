@@ -13,6 +13,7 @@ class FileResponse(BaseModel):
     original_name: str
     mime_type: str
     size: int
+    sha256: Optional[str] = None
     task_id: uuid.UUID
     uploaded_by: uuid.UUID
     created_at: datetime
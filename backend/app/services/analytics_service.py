@@ -1,92 +1,153 @@
 import csv
 import io
+import time
 import uuid
+import zlib
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional, Tuple
 
-from sqlalchemy import select, func, case, and_, extract, cast, Date
+from pydantic_core import to_json
+from sqlalchemy import (
+    and_,
+    extract,
+    func,
+    literal,
+    literal_column,
+    select,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import array
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
+from app.core.cache import StaleWhileRevalidate, create_cache
+from app.core.config import get_settings
+from app.core.database import async_session
 from app.models.task import Task, TaskStatus, TaskPriority
+from app.models.task_hourly_stat import TaskHourlyStat
+from app.models.task_status_event import TaskStatusEvent
 from app.models.user import User
+from app.schemas.common import CacheMeta
+from app.utils.exceptions import BadRequestException
 
+settings = get_settings()
 
-async def get_overview(
-    db: AsyncSession, assigned_to: Optional[uuid.UUID] = None
-) -> dict:
-    conditions = [Task.is_deleted == False]  # noqa: E712
-    if assigned_to:
-        conditions.append(Task.assigned_to == assigned_to)
+# Computed figures keyed by (endpoint, parameters). Entries expire from the
+# store at the hard TTL; past the soft TTL they are refreshed in the background.
+_analytics_cache = StaleWhileRevalidate(
+    create_cache(
+        "analytics",
+        maxsize=settings.ANALYTICS_CACHE_SIZE,
+        ttl=settings.ANALYTICS_CACHE_HARD_TTL,
+    ),
+    soft_ttl=settings.ANALYTICS_CACHE_SOFT_TTL,
+    hard_ttl=settings.ANALYTICS_CACHE_HARD_TTL,
+)
 
-    base = select(Task).where(and_(*conditions))
 
-    total_q = select(func.count()).select_from(base.subquery())
-    total = (await db.execute(total_q)).scalar() or 0
+async def cached(
+    db: AsyncSession, fn: Callable[..., Awaitable[Any]], **params
+) -> Tuple[Any, CacheMeta]:
+    """Run ``fn(db, **params)`` through the stale-while-revalidate cache.
 
-    status_q = (
-        select(Task.status, func.count())
-        .where(and_(*conditions))
-        .group_by(Task.status)
-    )
-    status_rows = (await db.execute(status_q)).all()
-    by_status = {row[0].value: row[1] for row in status_rows}
+    A miss is computed on the request's session; background refreshes open
+    their own, since the request's is closed by the time they run.
+    """
 
-    priority_q = (
-        select(Task.priority, func.count())
-        .where(and_(*conditions))
-        .group_by(Task.priority)
+    async def refresh():
+        async with async_session() as session:
+            return await fn(session, **params)
+
+    key = (fn.__name__, tuple(sorted(params.items())))
+    value, computed_at = await _analytics_cache.get(
+        key, lambda: fn(db, **params), refresh
+    )
+    age = max(0.0, time.time() - computed_at)
+    return value, CacheMeta(
+        computed_at=datetime.fromtimestamp(computed_at, timezone.utc),
+        age_seconds=round(age, 3),
+        stale=age >= _analytics_cache.soft_ttl,
     )
-    priority_rows = (await db.execute(priority_q)).all()
-    by_priority = {row[0].value: row[1] for row in priority_rows}
 
-    now = datetime.now(timezone.utc)
-    overdue_conditions = conditions + [
+
+def _overview_columns(now: datetime) -> list:
+    """Aggregate columns for the overview: totals by status and priority, and overdue."""
+    overdue = and_(
         Task.status != TaskStatus.DONE,
         Task.due_date != None,  # noqa: E711
         Task.due_date < now,
-    ]
-    overdue_q = (
-        select(func.count())
-        .select_from(Task)
-        .where(and_(*overdue_conditions))
     )
-    overdue = (await db.execute(overdue_q)).scalar() or 0
+    columns = [func.count().label("total"), func.count().filter(overdue).label("overdue")]
+    columns += [
+        func.count().filter(Task.status == status).label(status.value) for status in TaskStatus
+    ]
+    columns += [
+        func.count().filter(Task.priority == priority).label(priority.value)
+        for priority in TaskPriority
+    ]
+    return columns
+
 
+def _overview_from(row) -> dict:
     return {
-        "total": total,
-        "by_status": {
-            "TODO": by_status.get("TODO", 0),
-            "IN_PROGRESS": by_status.get("IN_PROGRESS", 0),
-            "DONE": by_status.get("DONE", 0),
-        },
-        "by_priority": {
-            "LOW": by_priority.get("LOW", 0),
-            "MEDIUM": by_priority.get("MEDIUM", 0),
-            "HIGH": by_priority.get("HIGH", 0),
-        },
-        "overdue": overdue,
+        "total": row["total"],
+        "by_status": {status.value: row[status.value] for status in TaskStatus},
+        "by_priority": {priority.value: row[priority.value] for priority in TaskPriority},
+        "overdue": row["overdue"],
     }
 
 
+async def get_overview(
+    db: AsyncSession, assigned_to: Optional[uuid.UUID] = None
+) -> dict:
+    """Totals by status and priority plus the overdue count, from one pass over the rows."""
+    conditions = [Task.is_deleted == False]  # noqa: E712
+    if assigned_to:
+        conditions.append(Task.assigned_to == assigned_to)
+
+    columns = _overview_columns(datetime.now(timezone.utc))
+    row = (await db.execute(select(*columns).where(and_(*conditions)))).one()._mapping
+    return _overview_from(row)
+
+
 async def get_performance(
     db: AsyncSession, assigned_to: Optional[uuid.UUID] = None
 ) -> list[dict]:
+    """Completed tasks per assignee with lead time, cycle time and recent throughput.
+
+    Lead time runs from creation to ``completed_at``; cycle time from the
+    task's first move to IN_PROGRESS. Both come from the completed-task index
+    and the status event log, so later edits to a task don't skew them.
+    """
     conditions = [
         Task.is_deleted == False,  # noqa: E712
-        Task.status == TaskStatus.DONE,
+        Task.completed_at != None,  # noqa: E711
         Task.assigned_to != None,  # noqa: E711
     ]
     if assigned_to:
         conditions.append(Task.assigned_to == assigned_to)
 
+    started_at = (
+        select(func.min(TaskStatusEvent.created_at))
+        .where(
+            TaskStatusEvent.task_id == Task.id,
+            TaskStatusEvent.to_status == TaskStatus.IN_PROGRESS,
+        )
+        .correlate(Task)
+        .scalar_subquery()
+    )
     completed_q = (
         select(
             Task.assigned_to,
             User.name,
             func.count().label("completed_tasks"),
             func.avg(
-                extract("epoch", Task.updated_at) - extract("epoch", Task.created_at)
+                extract("epoch", Task.completed_at) - extract("epoch", Task.created_at)
             ).label("avg_completion_seconds"),
+            func.avg(
+                extract("epoch", Task.completed_at) - extract("epoch", started_at)
+            ).label("avg_cycle_seconds"),
         )
         .join(User, Task.assigned_to == User.id)
         .where(and_(*conditions))
@@ -95,6 +156,21 @@ async def get_performance(
     )
     rows = (await db.execute(completed_q)).all()
 
+    week_conditions = [
+        TaskStatusEvent.to_status == TaskStatus.DONE,
+        TaskStatusEvent.created_at >= datetime.now(timezone.utc) - timedelta(days=7),
+    ]
+    if assigned_to:
+        week_conditions.append(TaskStatusEvent.assignee_id == assigned_to)
+    throughput_q = (
+        select(TaskStatusEvent.assignee_id, func.count().label("completed"))
+        .where(and_(*week_conditions))
+        .group_by(TaskStatusEvent.assignee_id)
+    )
+    throughput = {
+        row.assignee_id: row.completed for row in (await db.execute(throughput_q)).all()
+    }
+
     results = []
     for row in rows:
         avg_seconds = float(row.avg_completion_seconds or 0)
@@ -105,113 +181,392 @@ async def get_performance(
                 "user_name": row.name,
                 "completed_tasks": row.completed_tasks,
                 "avg_completion_time": avg_hours,
+                "avg_cycle_time": round(float(row.avg_cycle_seconds or 0) / 3600, 1),
+                "completed_last_7_days": throughput.get(row.assigned_to, 0),
             }
         )
     return results
 
 
-async def get_trends(
-    db: AsyncSession, days: int = 30, assigned_to: Optional[uuid.UUID] = None
-) -> list[dict]:
-    now = datetime.now(timezone.utc)
-    start = now - timedelta(days=days)
+def _hours(seconds) -> float:
+    return round(float(seconds or 0) / 3600, 1)
 
-    created_conditions = [
-        Task.is_deleted == False,  # noqa: E712
-        Task.created_at >= start,
-    ]
-    completed_conditions = [
+
+DASHBOARD_SECTIONS = ("overview", "performance", "trends")
+
+
+async def get_dashboard(
+    db: AsyncSession,
+    assigned_to: Optional[uuid.UUID] = None,
+    days: int = 30,
+    granularity: str = "day",
+    tz: str = "UTC",
+    sections: Tuple[str, ...] = DASHBOARD_SECTIONS,
+) -> dict:
+    """Overview, per-assignee performance and trends for the dashboard, one query each.
+
+    Only the requested ``sections`` are computed. The overview is the single
+    pass of ``get_overview``; with ``performance`` it also gains the overall
+    p50/p90 completion times. Trends are read from the rollup as in
+    ``get_trends``.
+    """
+    unknown = sorted(set(sections) - set(DASHBOARD_SECTIONS))
+    if unknown:
+        raise BadRequestException(f"Unknown section(s): {', '.join(unknown)}")
+
+    overview = performance = trends = None
+    if "overview" in sections:
+        overview = await get_overview(db, assigned_to)
+    if "performance" in sections:
+        completion_time, performance = await _dashboard_performance(db, assigned_to)
+        if overview is not None:
+            overview["completion_time"] = completion_time
+    if "trends" in sections:
+        trends = await get_trends(
+            db, days=days, assigned_to=assigned_to, granularity=granularity, tz=tz
+        )
+    data = {"overview": overview, "performance": performance, "trends": trends}
+    return {section: data[section] for section in DASHBOARD_SECTIONS if section in sections}
+
+
+async def _dashboard_performance(
+    db: AsyncSession, assigned_to: Optional[uuid.UUID] = None
+) -> Tuple[dict, list[dict]]:
+    """Overall completion times and per-assignee performance from one statement.
+
+    Only completed tasks are read, through the completed-task index, grouped
+    with ``ROLLUP(assigned_to)``: the grand total row gives the overall
+    completion times, the others per-assignee performance. Both percentiles
+    come from one ordered-set aggregate, so each group is sorted once.
+    Seven-day throughput is joined in from the status event log in the same
+    statement.
+    """
+    conditions = [
         Task.is_deleted == False,  # noqa: E712
-        Task.status == TaskStatus.DONE,
-        Task.updated_at >= start,
+        Task.completed_at != None,  # noqa: E711
     ]
     if assigned_to:
-        created_conditions.append(Task.assigned_to == assigned_to)
-        completed_conditions.append(Task.assigned_to == assigned_to)
-
-    created_day = cast(Task.created_at, Date).label("day")
-    created_q = (
-        select(created_day, func.count().label("count"))
-        .where(and_(*created_conditions))
-        .group_by(created_day)
-        .order_by(created_day)
-    )
-    created_rows = (await db.execute(created_q)).all()
+        conditions.append(Task.assigned_to == assigned_to)
 
-    completed_day = cast(Task.updated_at, Date).label("day")
-    completed_q = (
-        select(completed_day, func.count().label("count"))
-        .where(and_(*completed_conditions))
-        .group_by(completed_day)
-        .order_by(completed_day)
+    started_at = (
+        select(func.min(TaskStatusEvent.created_at))
+        .where(
+            TaskStatusEvent.task_id == Task.id,
+            TaskStatusEvent.to_status == TaskStatus.IN_PROGRESS,
+        )
+        .correlate(Task)
+        .scalar_subquery()
     )
-    completed_rows = (await db.execute(completed_q)).all()
+    completed_epoch = extract("epoch", Task.completed_at)
+    lead = completed_epoch - extract("epoch", Task.created_at)
+    stats = (
+        select(
+            Task.assigned_to,
+            func.grouping(Task.assigned_to).label("is_total"),
+            func.count().label("completed_tasks"),
+            func.avg(lead).label("avg_lead"),
+            func.percentile_cont(array([0.5, 0.9])).within_group(lead).label("lead_percentiles"),
+            func.avg(completed_epoch - extract("epoch", started_at)).label("avg_cycle"),
+        )
+        .where(and_(*conditions))
+        .group_by(func.rollup(Task.assigned_to))
+    ).subquery()
 
-    created_map = {row.day.isoformat(): row.count for row in created_rows}
-    completed_map = {row.day.isoformat(): row.count for row in completed_rows}
+    week_conditions = [
+        TaskStatusEvent.to_status == TaskStatus.DONE,
+        TaskStatusEvent.created_at >= datetime.now(timezone.utc) - timedelta(days=7),
+    ]
+    if assigned_to:
+        week_conditions.append(TaskStatusEvent.assignee_id == assigned_to)
+    throughput = (
+        select(TaskStatusEvent.assignee_id, func.count().label("completed"))
+        .where(and_(*week_conditions))
+        .group_by(TaskStatusEvent.assignee_id)
+    ).subquery()
 
-    all_dates: set[str] = set()
-    current = start.date()
-    while current <= now.date():
-        all_dates.add(current.strftime("%Y-%m-%d"))
-        current += timedelta(days=1)
+    query = (
+        select(stats, User.name, throughput.c.completed.label("completed_last_7_days"))
+        .outerjoin(User, User.id == stats.c.assigned_to)
+        .outerjoin(throughput, throughput.c.assignee_id == stats.c.assigned_to)
+        .order_by(stats.c.is_total.desc(), stats.c.completed_tasks.desc())
+    )
+    rows = [row._mapping for row in (await db.execute(query)).all()]
 
-    results = []
-    for date_str in sorted(all_dates):
-        results.append(
+    # ROLLUP returns the grand total row even when nothing is completed.
+    total = rows[0]
+    p50, p90 = total["lead_percentiles"] or (None, None)
+    completion_time = {"avg": _hours(total["avg_lead"]), "p50": _hours(p50), "p90": _hours(p90)}
+    performance = []
+    for row in rows[1:]:
+        if row["assigned_to"] is None:
+            continue
+        p50, p90 = row["lead_percentiles"]
+        performance.append(
             {
-                "date": date_str,
-                "created": created_map.get(date_str, 0),
-                "completed": completed_map.get(date_str, 0),
+                "user_id": str(row["assigned_to"]),
+                "user_name": row["name"],
+                "completed_tasks": row["completed_tasks"],
+                "avg_completion_time": _hours(row["avg_lead"]),
+                "p50_completion_time": _hours(p50),
+                "p90_completion_time": _hours(p90),
+                "avg_cycle_time": _hours(row["avg_cycle"]),
+                "completed_last_7_days": row["completed_last_7_days"] or 0,
             }
         )
-    return results
+    return completion_time, performance
 
 
-async def export_tasks_csv(
-    db: AsyncSession, assigned_to: Optional[uuid.UUID] = None
-) -> str:
+TREND_GRANULARITIES = ("day", "week", "month")
+
+
+def _check_timezone(tz: str) -> None:
+    if tz.upper() == "UTC":
+        return
+    try:
+        ZoneInfo(tz)
+    except (ZoneInfoNotFoundError, ValueError):
+        raise BadRequestException(f"Unknown timezone '{tz}'")
+
+
+def _whole_hour_offsets(tz: str, days: int) -> bool:
+    """Whether ``tz`` is a whole number of hours off UTC throughout the window.
+
+    Sampled daily back past the start of the first (at most month-long)
+    bucket; offsets only change at DST transitions, months apart.
+    """
+    if tz.upper() == "UTC":
+        return True
+    zone = ZoneInfo(tz)
+    now = datetime.now(timezone.utc)
+    return all(
+        (now - timedelta(days=day)).astimezone(zone).utcoffset() % timedelta(hours=1)
+        == timedelta(0)
+        for day in range(days + 32)
+    )
+
+
+async def get_trends(
+    db: AsyncSession,
+    days: int = 30,
+    assigned_to: Optional[uuid.UUID] = None,
+    granularity: str = "day",
+    tz: str = "UTC",
+) -> list[dict]:
+    """Tasks created and completed per day, week or month in ``tz``, in one query.
+
+    Buckets cover the last ``days`` days in the client's timezone, are
+    gap-filled by ``generate_series`` and labelled with their first day.
+    Counts are summed from the hourly UTC rollup, which lines up with local
+    days in any zone a whole number of hours off UTC. Zones with a
+    fractional offset (e.g. Asia/Kolkata) bucket the raw timestamps instead;
+    the range filter stays on the bare columns so it can use their indexes.
+    """
+    if granularity not in TREND_GRANULARITIES:
+        raise BadRequestException(f"Unknown granularity '{granularity}'")
+    _check_timezone(tz)
+
+    # Inlined (it is whitelisted above) so the bucket expression in SELECT
+    # and GROUP BY is textually identical.
+    unit = literal_column(f"'{granularity}'")
+    step = literal_column(f"interval '1 {granularity}'")
+    local_now = func.timezone(tz, func.now())
+    first = func.date_trunc(unit, local_now - timedelta(days=days))
+    since = func.timezone(tz, first)
+    buckets = (
+        select(
+            func.generate_series(first, func.date_trunc(unit, local_now), step).label("bucket")
+        )
+    ).subquery()
+
+    if _whole_hour_offsets(tz, days):
+        conditions = [TaskHourlyStat.hour >= since]
+        if assigned_to:
+            conditions.append(TaskHourlyStat.assignee_id == assigned_to)
+        events = (
+            select(
+                func.date_trunc(unit, func.timezone(tz, TaskHourlyStat.hour)).label("bucket"),
+                TaskHourlyStat.created.label("created"),
+                TaskHourlyStat.completed.label("completed"),
+            ).where(and_(*conditions))
+        ).subquery()
+    else:
+        conditions = [Task.is_deleted == False]  # noqa: E712
+        if assigned_to:
+            conditions.append(Task.assigned_to == assigned_to)
+        events = union_all(
+            select(
+                func.date_trunc(unit, func.timezone(tz, Task.created_at)).label("bucket"),
+                literal(1).label("created"),
+                literal(0).label("completed"),
+            ).where(and_(*conditions, Task.created_at >= since)),
+            select(
+                func.date_trunc(unit, func.timezone(tz, Task.completed_at)),
+                literal(0),
+                literal(1),
+            ).where(and_(*conditions, Task.completed_at >= since)),
+        ).subquery()
+    counts = (
+        select(
+            events.c.bucket,
+            func.sum(events.c.created).label("created"),
+            func.sum(events.c.completed).label("completed"),
+        ).group_by(events.c.bucket)
+    ).subquery()
+
+    query = (
+        select(
+            buckets.c.bucket,
+            func.coalesce(counts.c.created, 0).label("created"),
+            func.coalesce(counts.c.completed, 0).label("completed"),
+        )
+        .select_from(buckets.outerjoin(counts, counts.c.bucket == buckets.c.bucket))
+        .order_by(buckets.c.bucket)
+    )
+    return [
+        {
+            "date": row.bucket.date().isoformat(),
+            "created": int(row.created),
+            "completed": int(row.completed),
+        }
+        for row in (await db.execute(query)).all()
+    ]
+
+
+# (CSV header, NDJSON key) per exported column, in select order. New columns
+# go at the end so existing CSV consumers keep their column positions.
+EXPORT_FIELDS = [
+    ("ID", "id"),
+    ("Title", "title"),
+    ("Description", "description"),
+    ("Status", "status"),
+    ("Priority", "priority"),
+    ("Due Date", "due_date"),
+    ("Tags", "tags"),
+    ("Created At", "created_at"),
+    ("Updated At", "updated_at"),
+    ("Assignee", "assignee_name"),
+    ("Created By", "creator_name"),
+]
+
+
+def _csv_row(row) -> list:
+    (
+        id_, title, description, status, priority, due_date, tags,
+        created_at, updated_at, assignee_name, creator_name,
+    ) = row
+    return [
+        str(id_),
+        title,
+        description or "",
+        status.value,
+        priority.value,
+        due_date.isoformat() if due_date else "",
+        ", ".join(tags) if tags else "",
+        created_at.isoformat(),
+        updated_at.isoformat(),
+        assignee_name or "",
+        creator_name or "",
+    ]
+
+
+def _export_conditions(assigned_to: Optional[uuid.UUID]) -> list:
     conditions = [Task.is_deleted == False]  # noqa: E712
     if assigned_to:
         conditions.append(Task.assigned_to == assigned_to)
+    return conditions
+
+
+async def count_export_rows(db: AsyncSession, assigned_to: Optional[uuid.UUID] = None) -> int:
+    result = await db.execute(
+        select(func.count(Task.id)).where(and_(*_export_conditions(assigned_to)))
+    )
+    return result.scalar()
 
+
+async def export_rows(
+    assigned_to: Optional[uuid.UUID] = None, batch_size: int = 1000
+) -> AsyncIterator[list]:
+    """Export rows as plain tuples, ``batch_size`` at a time from a server-side cursor.
+
+    Assignee and creator names come from one outer join each. The stream
+    uses its own session because it outlives the request's.
+    """
+    assignee = aliased(User)
+    creator = aliased(User)
     query = (
-        select(Task)
-        .where(and_(*conditions))
+        select(
+            Task.id,
+            Task.title,
+            Task.description,
+            Task.status,
+            Task.priority,
+            Task.due_date,
+            Task.tags,
+            Task.created_at,
+            Task.updated_at,
+            assignee.name,
+            creator.name,
+        )
+        .outerjoin(assignee, assignee.id == Task.assigned_to)
+        .outerjoin(creator, creator.id == Task.created_by)
+        .where(and_(*_export_conditions(assigned_to)))
         .order_by(Task.created_at.desc())
-    )
-    result = await db.execute(query)
-    tasks = result.scalars().all()
-
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow(
-        [
-            "ID",
-            "Title",
-            "Description",
-            "Status",
-            "Priority",
-            "Due Date",
-            "Tags",
-            "Created At",
-            "Updated At",
-        ]
+        .execution_options(yield_per=batch_size)
     )
 
-    for task in tasks:
-        writer.writerow(
-            [
-                str(task.id),
-                task.title,
-                task.description or "",
-                task.status.value,
-                task.priority.value,
-                task.due_date.isoformat() if task.due_date else "",
-                ", ".join(task.tags) if task.tags else "",
-                task.created_at.isoformat(),
-                task.updated_at.isoformat(),
-            ]
-        )
+    async with async_session() as db:
+        result = await db.stream(query)
+        async for rows in result.partitions():
+            yield rows
+
+
+async def _csv_chunks(batches: AsyncIterator[list]) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow([header for header, _ in EXPORT_FIELDS])
+    yield buffer.getvalue().encode()
+    async for rows in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(map(_csv_row, rows))
+        yield buffer.getvalue().encode()
+
+
+async def _ndjson_chunks(batches: AsyncIterator[list]) -> AsyncIterator[bytes]:
+    keys = [key for _, key in EXPORT_FIELDS]
+    async for rows in batches:
+        yield b"".join(to_json(dict(zip(keys, row))) + b"\n" for row in rows)
+
+
+async def _gzip_chunks(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits 31: gzip container
+    async for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def encode_export(
+    batches: AsyncIterator[list], format: str = "csv", compression: Optional[str] = None
+) -> AsyncIterator[bytes]:
+    """Turn row batches into ``csv`` or ``ndjson`` bytes, optionally gzipped on the fly."""
+    chunks = _ndjson_chunks(batches) if format == "ndjson" else _csv_chunks(batches)
+    if compression == "gzip":
+        chunks = _gzip_chunks(chunks)
+    return chunks
+
+
+async def stream_tasks_export(
+    assigned_to: Optional[uuid.UUID] = None,
+    format: str = "csv",
+    compression: Optional[str] = None,
+    batch_size: int = 1000,
+) -> AsyncIterator[bytes]:
+    """Yield the task export chunk by chunk.
 
-    return output.getvalue()
+    Memory stays flat whatever the row count. The CSV header goes out
+    before the query runs.
+    """
+    async for chunk in encode_export(export_rows(assigned_to, batch_size), format, compression):
+        yield chunk
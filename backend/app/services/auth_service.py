@@ -3,10 +3,18 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.user import User
 from app.schemas.user import UserRegister
-from app.core.security import hash_password, verify_password, create_access_token, create_refresh_token
+from app.core.config import get_settings
+from app.core.security import (
+    hash_password_async,
+    verify_password_async,
+    create_access_token,
+    create_refresh_token,
+)
 from app.utils.exceptions import ConflictException, UnauthorizedException
 from app.utils.sanitize import sanitize_string
 
+settings = get_settings()
+
 
 async def register_user(db: AsyncSession, data: UserRegister) -> User:
     result = await db.execute(select(User).where(User.email == data.email))
@@ -16,7 +24,7 @@ async def register_user(db: AsyncSession, data: UserRegister) -> User:
     user = User(
         name=sanitize_string(data.name),
         email=data.email,
-        password=hash_password(data.password),
+        password=await hash_password_async(data.password),
     )
     db.add(user)
     await db.flush()
@@ -28,16 +36,19 @@ async def authenticate_user(db: AsyncSession, email: str, password: str) -> User
     result = await db.execute(select(User).where(User.email == email))
     user = result.scalar_one_or_none()
 
-    if not user or not verify_password(password, user.password):
+    if not user or not await verify_password_async(password, user.password):
         raise UnauthorizedException("Invalid email or password")
 
     return user
 
 
-def generate_tokens(user: User) -> dict:
+def generate_tokens(user: User, epoch: int = 0) -> dict:
     token_data = {"sub": str(user.id)}
+    access_data = {**token_data, "ep": epoch}
+    if settings.STATELESS_AUTH:
+        access_data.update(name=user.name, email=user.email)
     return {
-        "access_token": create_access_token(token_data),
+        "access_token": create_access_token(access_data),
         "refresh_token": create_refresh_token(token_data),
         "token_type": "bearer",
     }
@@ -1,7 +1,7 @@
 import uuid
-from typing import List
+from typing import List, Optional
 
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -43,6 +43,22 @@ async def create_comment(
     return result.scalar_one()
 
 
+async def comments_version(db: AsyncSession, task_id: uuid.UUID) -> Optional[tuple]:
+    """Validator for a task's comment list, or None if the task is gone."""
+    live_task = (
+        select(Task.id)
+        .where(and_(Task.id == task_id, Task.is_deleted == False))  # noqa: E712
+        .exists()
+    )
+    result = await db.execute(
+        select(live_task, func.count(Comment.id), func.max(Comment.updated_at)).where(
+            Comment.task_id == task_id
+        )
+    )
+    exists, count, latest = result.one()
+    return (count, latest) if exists else None
+
+
 async def list_comments(db: AsyncSession, task_id: uuid.UUID) -> List[Comment]:
     await _get_task_or_404(db, task_id)
 
@@ -0,0 +1,196 @@
+import asyncio
+import logging
+import os
+import uuid
+from contextlib import aclosing
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Optional
+
+import aiofiles
+from sqlalchemy import delete, select, update, and_, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.core.database import async_session
+from app.models.export_job import ExportJob, ExportJobStatus
+from app.services import analytics_service
+from app.utils.exceptions import ConflictException, NotFoundException
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+EXPORT_DIR = os.path.join(settings.UPLOAD_DIR, "exports")
+
+MEDIA_TYPES = {"csv": "text/csv", "ndjson": "application/x-ndjson"}
+
+
+def file_name(format: str, compression: Optional[str] = None) -> str:
+    """Download name, e.g. ``tasks_export.csv.gz``."""
+    return f"tasks_export.{format}" + (".gz" if compression == "gzip" else "")
+
+
+def media_type(format: str, compression: Optional[str] = None) -> str:
+    # Gzip is the file's type, not a transfer encoding: clients must keep the .gz.
+    return "application/gzip" if compression == "gzip" else MEDIA_TYPES[format]
+
+
+def job_path(job_id: uuid.UUID) -> str:
+    return os.path.join(EXPORT_DIR, f"{job_id}.export")
+
+
+def _expiry() -> datetime:
+    return datetime.now(timezone.utc) + timedelta(hours=settings.EXPORT_JOB_TTL_HOURS)
+
+
+async def create_job(
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    assigned_to: Optional[uuid.UUID] = None,
+    format: str = "csv",
+    compression: Optional[str] = None,
+) -> ExportJob:
+    job = ExportJob(
+        user_id=user_id,
+        assigned_to=assigned_to,
+        format=format,
+        compression=compression,
+        status=ExportJobStatus.PENDING,
+        rows_written=0,
+    )
+    db.add(job)
+    # Committed here: the runner works on its own session and must see the row.
+    await db.commit()
+    return job
+
+
+async def get_job(db: AsyncSession, job_id: uuid.UUID, user_id: uuid.UUID) -> ExportJob:
+    unexpired = or_(
+        ExportJob.expires_at == None,  # noqa: E711
+        ExportJob.expires_at > datetime.now(timezone.utc),
+    )
+    result = await db.execute(
+        select(ExportJob).where(
+            and_(ExportJob.id == job_id, ExportJob.user_id == user_id, unexpired)
+        )
+    )
+    job = result.scalar_one_or_none()
+    if not job:
+        raise NotFoundException("Export job not found")
+    return job
+
+
+async def get_download(db: AsyncSession, job_id: uuid.UUID, user_id: uuid.UUID) -> ExportJob:
+    job = await get_job(db, job_id, user_id)
+    if job.status != ExportJobStatus.COMPLETED:
+        raise ConflictException(f"Export is {job.status.value.lower()}, not ready to download")
+    return job
+
+
+async def run_job(job_id: uuid.UUID) -> None:
+    """Write the export to ``job_path`` and record progress after every batch.
+
+    The file is written under a temporary name and renamed once complete,
+    so a download never sees a partial file.
+    """
+    async with async_session() as db:
+        job = await db.get(ExportJob, job_id)
+        if job is None:
+            return
+        path = job_path(job.id)
+        partial = path + ".part"
+        try:
+            job.status = ExportJobStatus.RUNNING
+            job.heartbeat_at = datetime.now(timezone.utc)
+            job.total_rows = await analytics_service.count_export_rows(db, job.assigned_to)
+            await db.commit()
+
+            async def counted(batches: AsyncIterator[list]) -> AsyncIterator[list]:
+                async for rows in batches:
+                    yield rows
+                    job.rows_written += len(rows)
+                    job.heartbeat_at = datetime.now(timezone.utc)
+                    await db.commit()
+
+            os.makedirs(EXPORT_DIR, exist_ok=True)
+            # Closed explicitly so export_rows releases its session and cursor
+            # as soon as writing stops, failed or not, rather than at GC.
+            async with aclosing(analytics_service.export_rows(job.assigned_to)) as rows:
+                async with aclosing(
+                    analytics_service.encode_export(counted(rows), job.format, job.compression)
+                ) as chunks:
+                    async with aiofiles.open(partial, "wb") as out:
+                        async for chunk in chunks:
+                            await out.write(chunk)
+            os.replace(partial, path)
+
+            job.status = ExportJobStatus.COMPLETED
+            job.size = os.path.getsize(path)
+            job.finished_at = datetime.now(timezone.utc)
+            job.expires_at = _expiry()
+            await db.commit()
+        except Exception as exc:
+            logger.exception("Export job %s failed", job_id)
+            if os.path.exists(partial):
+                os.remove(partial)
+            try:
+                await db.rollback()
+                job.status = ExportJobStatus.FAILED
+                job.error = str(exc)[:500]
+                job.finished_at = datetime.now(timezone.utc)
+                job.expires_at = _expiry()
+                await db.commit()
+            except Exception:
+                # E.g. the connection itself was lost; fail_stale_jobs picks
+                # the job up once its heartbeat goes stale.
+                logger.exception("Could not mark export job %s failed", job_id)
+
+
+async def fail_stale_jobs(db: AsyncSession) -> int:
+    """Fail unfinished jobs whose runner stopped reporting, e.g. after a restart.
+
+    Their partial file stays until the job expires, in case the runner is
+    only slow; returns how many were failed.
+    """
+    now = datetime.now(timezone.utc)
+    result = await db.execute(
+        update(ExportJob)
+        .where(
+            ExportJob.status.in_([ExportJobStatus.PENDING, ExportJobStatus.RUNNING]),
+            ExportJob.heartbeat_at < now - timedelta(seconds=settings.EXPORT_JOB_STALE_SECONDS),
+        )
+        .values(
+            status=ExportJobStatus.FAILED,
+            error="Export was interrupted",
+            finished_at=now,
+            expires_at=_expiry(),
+        )
+    )
+    await db.commit()
+    return result.rowcount
+
+
+async def reap_expired_jobs(db: AsyncSession) -> int:
+    """Delete expired jobs and their files; returns how many were removed."""
+    result = await db.execute(
+        delete(ExportJob)
+        .where(ExportJob.expires_at <= datetime.now(timezone.utc))
+        .returning(ExportJob.id)
+    )
+    job_ids = result.scalars().all()
+    await db.commit()
+    for job_id in job_ids:
+        for path in (job_path(job_id), job_path(job_id) + ".part"):
+            if os.path.exists(path):
+                os.remove(path)
+    return len(job_ids)
+
+
+async def run_export_reaper(interval: float) -> None:
+    while True:
+        try:
+            async with async_session() as db:
+                await fail_stale_jobs(db)
+                await reap_expired_jobs(db)
+        except Exception:
+            logger.exception("Failed to reap expired export jobs")
+        await asyncio.sleep(interval)
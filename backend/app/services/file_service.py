@@ -1,6 +1,7 @@
+import hashlib
 import os
 import uuid
-from typing import List
+from typing import List, Tuple
 
 import aiofiles
 from fastapi import UploadFile
@@ -19,6 +20,10 @@ from app.utils.exceptions import (
 
 settings = get_settings()
 
+# Uploads are copied to disk in pieces of this size, so memory per upload
+# stays constant whatever the file size.
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
 ALLOWED_EXTENSIONS = {
     ".jpg", ".jpeg", ".png", ".gif", ".webp", ".svg",
     ".pdf", ".doc", ".docx", ".xls", ".xlsx", ".ppt", ".pptx",
@@ -48,6 +53,40 @@ def _validate_file(upload: UploadFile) -> None:
         )
 
 
+def _too_large(upload: UploadFile) -> BadRequestException:
+    return BadRequestException(
+        f"File '{upload.filename}' exceeds the {settings.MAX_UPLOAD_SIZE // (1024 * 1024)}MB limit"
+    )
+
+
+async def _store_upload(upload: UploadFile, file_path: str) -> Tuple[int, str]:
+    """Copy ``upload`` to ``file_path`` chunk by chunk; returns (size, SHA-256 hex digest).
+
+    Stops as soon as the size limit is crossed. The data goes to a ``.part``
+    file that is renamed into place once complete, so a partial upload never
+    appears under its final name.
+    """
+    if upload.size is not None and upload.size > settings.MAX_UPLOAD_SIZE:
+        raise _too_large(upload)
+
+    partial = file_path + ".part"
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        async with aiofiles.open(partial, "wb") as out:
+            while chunk := await upload.read(UPLOAD_CHUNK_SIZE):
+                size += len(chunk)
+                if size > settings.MAX_UPLOAD_SIZE:
+                    raise _too_large(upload)
+                digest.update(chunk)
+                await out.write(chunk)
+        os.replace(partial, file_path)
+    finally:
+        if os.path.exists(partial):
+            os.remove(partial)
+    return size, digest.hexdigest()
+
+
 async def upload_files(
     db: AsyncSession,
     task_id: uuid.UUID,
@@ -59,36 +98,38 @@ async def upload_files(
     if not uploads:
         raise BadRequestException("No files provided")
 
-    saved: List[File] = []
-
     for upload in uploads:
         _validate_file(upload)
 
-        content = await upload.read()
-        if len(content) > settings.MAX_UPLOAD_SIZE:
-            raise BadRequestException(
-                f"File '{upload.filename}' exceeds the {settings.MAX_UPLOAD_SIZE // (1024 * 1024)}MB limit"
+    saved: List[File] = []
+    written: List[str] = []
+    try:
+        for upload in uploads:
+            ext = os.path.splitext(upload.filename)[1].lower()
+            stored_name = f"{uuid.uuid4().hex}{ext}"
+            file_path = os.path.join(settings.UPLOAD_DIR, stored_name)
+
+            size, sha256 = await _store_upload(upload, file_path)
+            written.append(file_path)
+
+            file_record = File(
+                filename=stored_name,
+                original_name=upload.filename,
+                mime_type=upload.content_type or "application/octet-stream",
+                size=size,
+                sha256=sha256,
+                task_id=task_id,
+                uploaded_by=user_id,
             )
-
-        ext = os.path.splitext(upload.filename)[1].lower()
-        stored_name = f"{uuid.uuid4().hex}{ext}"
-        file_path = os.path.join(settings.UPLOAD_DIR, stored_name)
-
-        async with aiofiles.open(file_path, "wb") as f:
-            await f.write(content)
-
-        file_record = File(
-            filename=stored_name,
-            original_name=upload.filename,
-            mime_type=upload.content_type or "application/octet-stream",
-            size=len(content),
-            task_id=task_id,
-            uploaded_by=user_id,
-        )
-        db.add(file_record)
-        saved.append(file_record)
-
-    await db.flush()
+            db.add(file_record)
+            saved.append(file_record)
+
+        await db.flush()
+    except BaseException:
+        # Don't leave earlier files of a rejected batch behind on disk.
+        for file_path in written:
+            os.remove(file_path)
+        raise
 
     file_ids = [f.id for f in saved]
     result = await db.execute(
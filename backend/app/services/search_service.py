@@ -0,0 +1,49 @@
+import re
+from typing import Optional
+
+from sqlalchemy import func, or_, literal
+
+from app.models.task import Task
+
+TEXT_SEARCH_CONFIG = "english"
+
+# pg_trgm can only use its index for patterns with at least one full trigram.
+MIN_TRIGRAM_LENGTH = 3
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def _prefix_tsquery(term: str):
+    """Build an AND-ed prefix tsquery, so "deplo fail" matches "deployment failed"."""
+    words = _WORD_RE.findall(term.lower())
+    if not words:
+        return None
+    query = " & ".join(f"{word}:*" for word in words)
+    return func.to_tsquery(TEXT_SEARCH_CONFIG, query)
+
+
+def search_condition(term: str):
+    """Match tasks against ``term`` using indexed lookups only.
+
+    Whole and leading-partial words go through the ``search_vector`` GIN
+    index. Substrings inside words ("ploy" in "deploy") fall back to the
+    trigram indexes on title and description, which PostgreSQL can use for
+    ILIKE once the term is long enough to contain a trigram.
+    """
+    tsquery = _prefix_tsquery(term)
+    conditions = []
+    if tsquery is not None:
+        conditions.append(Task.search_vector.op("@@")(tsquery))
+    if tsquery is None or len(term) >= MIN_TRIGRAM_LENGTH:
+        conditions.append(Task.title.ilike(f"%{term}%"))
+        conditions.append(Task.description.ilike(f"%{term}%"))
+    return or_(*conditions)
+
+
+def search_rank(term: str):
+    """Relevance score for ``sort_by=relevance``; higher is better."""
+    tsquery: Optional[object] = _prefix_tsquery(term)
+    text_rank = (
+        func.ts_rank_cd(Task.search_vector, tsquery) if tsquery is not None else literal(0.0)
+    )
+    return text_rank + func.similarity(Task.title, term)
@@ -0,0 +1,101 @@
+import uuid
+from collections import defaultdict
+from typing import Iterable, Sequence
+
+from sqlalchemy import and_, delete, func, literal, select, text, union_all
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.task import Task
+from app.models.task_hourly_stat import TaskHourlyStat, UNASSIGNED
+
+
+def _contributions(state: dict) -> Iterable[tuple]:
+    """(hour, assignee, created, completed) rows a task state counts towards."""
+    if state["is_deleted"]:
+        return
+    assignee = uuid.UUID(state["assigned_to"]) if state["assigned_to"] else UNASSIGNED
+    yield state["created_hour"], assignee, 1, 0
+    if state["completed_hour"]:
+        yield state["completed_hour"], assignee, 0, 1
+
+
+async def record_task_changes(
+    db: AsyncSession, before: Sequence[dict], after: Sequence[dict]
+) -> None:
+    """Apply the difference between task states to the hourly rollup.
+
+    ``before``/``after`` are task-state snapshots around a flushed write (an
+    empty ``before`` for inserts). Counters are adjusted with one upsert.
+    """
+    deltas = defaultdict(lambda: [0, 0])
+    for sign, states in ((-1, before), (1, after)):
+        for state in states:
+            for hour, assignee, created, completed in _contributions(state):
+                delta = deltas[(hour, assignee)]
+                delta[0] += sign * created
+                delta[1] += sign * completed
+
+    # Sorted so concurrent writers lock rollup rows in the same order.
+    rows = [
+        {"hour": hour, "assignee_id": assignee, "created": created, "completed": completed}
+        for (hour, assignee), (created, completed) in sorted(deltas.items())
+        if created or completed
+    ]
+    if not rows:
+        return
+
+    stmt = insert(TaskHourlyStat).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[TaskHourlyStat.hour, TaskHourlyStat.assignee_id],
+        set_={
+            "created": TaskHourlyStat.created + stmt.excluded.created,
+            "completed": TaskHourlyStat.completed + stmt.excluded.completed,
+        },
+    )
+    await db.execute(stmt)
+
+
+def _utc_hour(column):
+    """Start of the UTC hour ``column`` falls in, independent of the session zone."""
+    return func.timezone("UTC", func.date_trunc("hour", func.timezone("UTC", column)))
+
+
+async def rebuild_hourly_stats(db: AsyncSession) -> int:
+    """Recompute the whole rollup from ``tasks``; returns the number of rows.
+
+    The table is locked first, so task writes running concurrently wait and
+    then apply their deltas on top of the rebuilt counts.
+    """
+    await db.execute(text("LOCK TABLE task_hourly_stats IN EXCLUSIVE MODE"))
+    await db.execute(delete(TaskHourlyStat))
+
+    live = Task.is_deleted == False  # noqa: E712
+    assignee = func.coalesce(Task.assigned_to, UNASSIGNED)
+    counted = union_all(
+        select(
+            _utc_hour(Task.created_at).label("hour"),
+            assignee.label("assignee_id"),
+            literal(1).label("created"),
+            literal(0).label("completed"),
+        ).where(live),
+        select(
+            _utc_hour(Task.completed_at),
+            assignee,
+            literal(0),
+            literal(1),
+        ).where(and_(live, Task.completed_at != None)),  # noqa: E711
+    ).subquery()
+
+    result = await db.execute(
+        insert(TaskHourlyStat).from_select(
+            ["hour", "assignee_id", "created", "completed"],
+            select(
+                counted.c.hour,
+                counted.c.assignee_id,
+                func.sum(counted.c.created),
+                func.sum(counted.c.completed),
+            ).group_by(counted.c.hour, counted.c.assignee_id),
+        )
+    )
+    return result.rowcount
@@ -1,19 +1,159 @@
 import uuid
 from datetime import datetime, timezone
-from typing import Optional, List, Tuple
+from typing import Any, Optional, List, Tuple
 
-from sqlalchemy import select, func, or_, and_
+from pydantic import TypeAdapter
+from pydantic_core import to_jsonable_python
+from sqlalchemy import event, select, func, or_, and_, tuple_, literal
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import Session, aliased, contains_eager, selectinload
 
+from app.core.cache import create_cache
+from app.core.config import get_settings
 from app.models.task import Task, TaskStatus, TaskPriority
 from app.models.comment import Comment
 from app.models.file import File
+from app.models.task_status_event import TaskStatusEvent
 from app.models.user import User
-from app.schemas.task import TaskCreate, TaskUpdate
+from app.schemas.task import TaskCreate, TaskUpdate, TaskResponse
+from app.services import search_service, stats_service
+from app.utils.cursor import encode_cursor, decode_cursor
 from app.utils.exceptions import NotFoundException, ForbiddenException, BadRequestException
+from app.utils.explain import estimate_rows
 from app.utils.sanitize import sanitize_string
 
+settings = get_settings()
+
+# Filtered totals keyed by filter signature, for the "cached" count strategy.
+_count_cache = create_cache(
+    "task_counts",
+    maxsize=settings.TASK_COUNT_CACHE_SIZE,
+    ttl=settings.TASK_COUNT_CACHE_TTL,
+)
+# Finished list pages keyed by (filter signature, page view).
+_list_cache = create_cache(
+    "task_lists",
+    backend=settings.TASK_LIST_CACHE_BACKEND,
+    maxsize=settings.TASK_LIST_CACHE_SIZE,
+    ttl=settings.TASK_LIST_CACHE_TTL,
+)
+
+_task_rows = TypeAdapter(List[TaskResponse])
+
+
+def _utc_hour(moment: datetime) -> datetime:
+    return moment.astimezone(timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+
+def _task_state(task: Task) -> dict:
+    """The attributes caches and the hourly rollup depend on, captured around a write."""
+    return {
+        "is_deleted": task.is_deleted,
+        "status": task.status.value if task.status else None,
+        "priority": task.priority.value if task.priority else None,
+        "assigned_to": str(task.assigned_to) if task.assigned_to else None,
+        "tags": set(task.tags or ()),
+        "created_hour": _utc_hour(task.created_at),
+        "completed_hour": _utc_hour(task.completed_at) if task.completed_at else None,
+    }
+
+
+def _set_status(task: Task, status: TaskStatus) -> None:
+    """Change status, keeping ``completed_at`` in step. Call before flushing."""
+    if status == TaskStatus.DONE and task.completed_at is None:
+        task.completed_at = datetime.now(timezone.utc)
+    elif status != TaskStatus.DONE:
+        task.completed_at = None
+    task.status = status
+
+
+def _log_transition(
+    db: AsyncSession, task: Task, from_status: Optional[TaskStatus], user_id: uuid.UUID
+) -> None:
+    """Queue a status event for a flushed task; it is inserted with the next flush.
+
+    For an existing task, ``from_status`` must be read from a row held by
+    ``_lock_task``; two unlocked updates could both see the old status and
+    log the same transition twice.
+    """
+    db.add(
+        TaskStatusEvent(
+            task_id=task.id,
+            from_status=from_status,
+            to_status=task.status,
+            assignee_id=task.assigned_to,
+            changed_by=user_id,
+            created_at=task.completed_at or datetime.now(timezone.utc),
+        )
+    )
+
+
+def _signature_matches(signature: tuple, states: List[dict]) -> bool:
+    status, priority, search, tags, assigned_to = signature
+    for state in states:
+        if state["is_deleted"]:
+            continue
+        if status and state["status"] != status:
+            continue
+        if priority and state["priority"] != priority:
+            continue
+        if assigned_to and state["assigned_to"] != assigned_to:
+            continue
+        if tags and not state["tags"].intersection(tags):
+            continue
+        # Search terms are not re-evaluated here; any surviving entry may match.
+        return True
+    return False
+
+
+def _invalidate_counts(states: List[dict]) -> None:
+    for key in _count_cache.keys():
+        if _signature_matches(key, states):
+            _count_cache.delete(key)
+
+
+def _invalidate_pages(states: List[dict]) -> None:
+    for key in _list_cache.keys():
+        if _signature_matches(key[0], states):
+            _list_cache.delete(key)
+
+
+def invalidate_task_caches(*states: dict) -> None:
+    """Drop cached counts and pages whose filters could include the written task.
+
+    ``states`` are ``_task_state`` snapshots from before and/or after the
+    write, so entries the task left and entries it joined both go.
+    """
+    _invalidate_counts(list(states))
+    _invalidate_pages(list(states))
+
+
+# session.info key for task states whose cache entries go stale on commit.
+_PENDING_INVALIDATION = "task_cache_states"
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session: Session) -> None:
+    states = session.info.pop(_PENDING_INVALIDATION, None)
+    if states:
+        invalidate_task_caches(*states)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back(session: Session) -> None:
+    session.info.pop(_PENDING_INVALIDATION, None)
+
+
+async def _task_written(db: AsyncSession, before: List[dict], after: List[dict]) -> None:
+    """Bring derived data in line with a flushed task write.
+
+    The rollup is updated in the same transaction. Cached counts and pages
+    are dropped only after the commit: dropping them earlier would let a
+    concurrent request refill them from the pre-commit rows.
+    """
+    db.info.setdefault(_PENDING_INVALIDATION, []).extend([*before, *after])
+    await stats_service.record_task_changes(db, before, after)
+
 
 async def create_task(db: AsyncSession, data: TaskCreate, user_id: uuid.UUID) -> Task:
     if data.assigned_to:
@@ -33,8 +173,11 @@ async def create_task(db: AsyncSession, data: TaskCreate, user_id: uuid.UUID) ->
         assigned_to=data.assigned_to,
         created_by=user_id,
     )
+    _set_status(task, task.status)
     db.add(task)
     await db.flush()
+    _log_transition(db, task, None, user_id)
+    await _task_written(db, [], [_task_state(task)])
 
     result = await db.execute(
         select(Task)
@@ -44,61 +187,464 @@ async def create_task(db: AsyncSession, data: TaskCreate, user_id: uuid.UUID) ->
     return result.scalar_one()
 
 
-async def list_tasks(
-    db: AsyncSession,
+SORT_FIELDS = {
+    "created_at": Task.created_at,
+    "updated_at": Task.updated_at,
+    "title": Task.title,
+    "status": Task.status,
+    "priority": Task.priority,
+    "due_date": Task.due_date,
+}
+
+
+def _filter_conditions(
     status: Optional[str] = None,
     priority: Optional[str] = None,
     search: Optional[str] = None,
-    sort_by: str = "created_at",
-    order: str = "desc",
-    page: int = 1,
-    limit: int = 10,
     tags: Optional[List[str]] = None,
     assigned_to: Optional[uuid.UUID] = None,
-) -> Tuple[List[Task], int]:
-    base_query = select(Task).where(Task.is_deleted == False)  # noqa: E712
+) -> list:
+    conditions = [Task.is_deleted == False]  # noqa: E712
 
     if status:
-        base_query = base_query.where(Task.status == TaskStatus(status))
+        conditions.append(Task.status == TaskStatus(status))
     if priority:
-        base_query = base_query.where(Task.priority == TaskPriority(priority))
+        conditions.append(Task.priority == TaskPriority(priority))
     if search:
-        search_filter = or_(
-            Task.title.ilike(f"%{search}%"),
-            Task.description.ilike(f"%{search}%"),
-        )
-        base_query = base_query.where(search_filter)
+        conditions.append(search_service.search_condition(search))
     if tags:
-        base_query = base_query.where(Task.tags.overlap(tags))
+        conditions.append(Task.tags.overlap(tags))
     if assigned_to:
-        base_query = base_query.where(Task.assigned_to == assigned_to)
-
-    count_query = select(func.count()).select_from(base_query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
-
-    allowed_sort_fields = {
-        "created_at": Task.created_at,
-        "updated_at": Task.updated_at,
-        "title": Task.title,
-        "status": Task.status,
-        "priority": Task.priority,
-        "due_date": Task.due_date,
-    }
-    sort_column = allowed_sort_fields.get(sort_by, Task.created_at)
+        conditions.append(Task.assigned_to == assigned_to)
+    return conditions
 
+
+def _order_by(sort_by: str, order: str, search: Optional[str] = None) -> list:
+    if sort_by == "relevance" and search:
+        sort_column = search_service.search_rank(search)
+    else:
+        sort_column = SORT_FIELDS.get(sort_by, Task.created_at)
     if order == "asc":
-        base_query = base_query.order_by(sort_column.asc())
+        return [sort_column.asc(), Task.id.asc()]
+    return [sort_column.desc(), Task.id.desc()]
+
+
+def _filter_signature(
+    status: Optional[str] = None,
+    priority: Optional[str] = None,
+    search: Optional[str] = None,
+    tags: Optional[List[str]] = None,
+    assigned_to: Optional[uuid.UUID] = None,
+) -> tuple:
+    return (
+        status,
+        priority,
+        search,
+        tuple(sorted(tags)) if tags else None,
+        str(assigned_to) if assigned_to else None,
+    )
+
+
+def _count_query(conditions: list):
+    return select(func.count()).select_from(Task).where(and_(*conditions))
+
+
+async def _uncounted_total(
+    db: AsyncSession,
+    conditions: list,
+    strategy: str = "exact",
+    signature: Optional[tuple] = None,
+) -> Optional[int]:
+    """Total obtainable without counting rows, or None if it must be counted.
+
+    ``estimated`` reads the planner's row estimate; ``cached`` serves a recent
+    exact count for the same filters, which is dropped on any task write.
+    ``exact`` (and a cache miss) leaves the count to the page query itself.
+    """
+    if strategy == "estimated":
+        return await estimate_rows(db, select(Task.id).where(and_(*conditions)))
+    if strategy == "cached":
+        return _count_cache.get(signature)
+    return None
+
+
+LIST_FIELDS = (
+    "id",
+    "title",
+    "description",
+    "status",
+    "priority",
+    "due_date",
+    "tags",
+    "assigned_to",
+    "created_by",
+    "is_deleted",
+    "created_at",
+    "updated_at",
+    "creator",
+    "assignee",
+)
+_USER_FIELDS = ("id", "name", "email", "avatar", "created_at", "updated_at")
+_USER_RELATIONS = ("creator", "assignee")
+
+
+def _resolve_fields(fields: List[str]) -> List[str]:
+    """Validate a sparse fieldset; ``id`` is always returned."""
+    unknown = sorted(set(fields) - set(LIST_FIELDS))
+    if unknown:
+        raise BadRequestException(f"Unknown field(s): {', '.join(unknown)}")
+    return [f for f in LIST_FIELDS if f == "id" or f in fields]
+
+
+def _page_query(fields: Optional[List[str]] = None):
+    """Select a page of tasks with creator and assignee joined in.
+
+    Without ``fields`` this loads full ``Task`` entities. With a fieldset it
+    selects only those columns (labelled ``creator__name`` etc. for the
+    joined users), which the caller turns into plain dicts without ORM
+    hydration.
+    """
+    creator = aliased(User)
+    assignee = aliased(User)
+    joins = {"creator": (creator, Task.created_by), "assignee": (assignee, Task.assigned_to)}
+
+    if fields is None:
+        return (
+            select(Task)
+            .join(creator, Task.created_by == creator.id)
+            .outerjoin(assignee, Task.assigned_to == assignee.id)
+            .options(
+                contains_eager(Task.creator.of_type(creator)),
+                contains_eager(Task.assignee.of_type(assignee)),
+            )
+        )
+
+    columns = [getattr(Task, f).label(f) for f in fields if f not in _USER_RELATIONS]
+    for relation in _USER_RELATIONS:
+        if relation in fields:
+            user = joins[relation][0]
+            columns += [getattr(user, c).label(f"{relation}__{c}") for c in _USER_FIELDS]
+
+    query = select(*columns).select_from(Task)
+    for relation in _USER_RELATIONS:
+        if relation in fields:
+            user, foreign_key = joins[relation]
+            query = query.outerjoin(user, foreign_key == user.id)
+    return query
+
+
+def _project_row(mapping) -> dict:
+    row: dict = {}
+    for key, value in mapping.items():
+        if key == "total":
+            continue
+        relation, sep, column = key.partition("__")
+        if sep:
+            row.setdefault(relation, {})[column] = value
+        else:
+            row[key] = value
+    for relation in _USER_RELATIONS:
+        if relation in row and row[relation]["id"] is None:
+            row[relation] = None
+    return to_jsonable_python(row)
+
+
+async def _fetch_page(
+    db: AsyncSession,
+    query,
+    total: Optional[int],
+    total_column,
+    conditions: list,
+    strategy: str,
+    signature: tuple,
+    maybe_past_end: bool,
+    projected: bool = False,
+) -> Tuple[list, int]:
+    """Run the page query, carrying the count along when ``total`` is unknown.
+
+    Items come back as JSON-ready dicts: projected rows directly from their
+    mappings, full ``Task`` entities through the ``TaskResponse`` schema.
+    """
+    counted = total is None
+    if counted:
+        query = query.add_columns(total_column.label("total"))
+
+    result = await db.execute(query)
+    rows = result.all()
+    if projected:
+        items = [_project_row(row._mapping) for row in rows]
+    else:
+        tasks = _task_rows.validate_python([row[0] for row in rows], from_attributes=True)
+        items = _task_rows.dump_python(tasks, mode="json")
+
+    if not counted:
+        return items, total
+
+    if rows:
+        total = rows[0].total
+    elif maybe_past_end:
+        # Nothing came back to carry the count; the page may simply be past the end.
+        total = (await db.execute(_count_query(conditions))).scalar() or 0
     else:
-        base_query = base_query.order_by(sort_column.desc())
+        total = 0
+
+    if strategy == "cached":
+        _count_cache.set(signature, total)
+    return items, total
+
+
+async def list_tasks(
+    db: AsyncSession,
+    status: Optional[str] = None,
+    priority: Optional[str] = None,
+    search: Optional[str] = None,
+    sort_by: str = "created_at",
+    order: str = "desc",
+    page: int = 1,
+    limit: int = 10,
+    tags: Optional[List[str]] = None,
+    assigned_to: Optional[uuid.UUID] = None,
+    count_strategy: str = "exact",
+    fields: Optional[List[str]] = None,
+) -> Tuple[List[dict], int]:
+    """Offset-paginated task listing, as JSON-ready dicts.
+
+    The page, its creator and assignee, and (when it has to be counted) the
+    filtered total come back from a single statement, with the total carried
+    on every row as ``count(*) OVER ()`` from a tasks-only subquery that also
+    picks the page's ids. With ``fields`` each dict holds only
+    those fields. Finished pages are cached until a matching task is written
+    or the TTL runs out.
+    """
+    if fields is not None:
+        fields = _resolve_fields(fields)
+    signature = _filter_signature(status, priority, search, tags, assigned_to)
+    cache_key = (
+        signature,
+        ("offset", sort_by, order, page, limit, count_strategy, fields and tuple(fields)),
+    )
+    cached = _list_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    conditions = _filter_conditions(status, priority, search, tags, assigned_to)
+    total = await _uncounted_total(db, conditions, count_strategy, signature)
 
     offset = (page - 1) * limit
-    base_query = base_query.offset(offset).limit(limit)
-    base_query = base_query.options(selectinload(Task.creator), selectinload(Task.assignee))
+    order_by = _order_by(sort_by, order, search)
+    total_column = None
+    if total is None:
+        # count(*) OVER () has to see every filtered row before OFFSET/LIMIT,
+        # so it runs over tasks alone; only the page's rows are joined to users.
+        page_ids = (
+            select(Task.id, func.count().over().label("total"))
+            .where(and_(*conditions))
+            .order_by(*order_by)
+            .offset(offset)
+            .limit(limit)
+        ).subquery()
+        query = _page_query(fields).join(page_ids, page_ids.c.id == Task.id).order_by(*order_by)
+        total_column = page_ids.c.total
+    else:
+        query = (
+            _page_query(fields)
+            .where(and_(*conditions))
+            .order_by(*order_by)
+            .offset(offset)
+            .limit(limit)
+        )
+    page_result = await _fetch_page(
+        db,
+        query,
+        total,
+        total_column,
+        conditions,
+        count_strategy,
+        signature,
+        maybe_past_end=offset > 0,
+        projected=fields is not None,
+    )
+    _list_cache.set(cache_key, page_result)
+    return page_result
 
-    result = await db.execute(base_query)
-    tasks = list(result.scalars().all())
-    return tasks, total
+
+def _encode_task_cursor(row: dict, sort_by: str, order: str, direction: str) -> str:
+    # Rows are already JSON-ready, so the sort key is a plain string or null.
+    return encode_cursor(
+        {"s": sort_by, "o": order, "d": direction, "v": row[sort_by], "id": row["id"]}
+    )
+
+
+def _decode_task_cursor(
+    cursor: str, sort_by: str, order: str
+) -> Tuple[str, Any, uuid.UUID]:
+    payload = decode_cursor(cursor)
+    if payload.get("s") != sort_by or payload.get("o") != order:
+        raise BadRequestException("Cursor does not match the requested sort order")
+    if payload.get("d") not in ("next", "prev"):
+        raise BadRequestException("Invalid pagination cursor")
+
+    raw = payload.get("v")
+    try:
+        task_id = uuid.UUID(payload.get("id"))
+        if raw is None:
+            value = None
+        elif sort_by in ("created_at", "updated_at", "due_date"):
+            value = datetime.fromisoformat(raw)
+        elif sort_by == "status":
+            value = TaskStatus(raw)
+        elif sort_by == "priority":
+            value = TaskPriority(raw)
+        else:
+            value = str(raw)
+    except (TypeError, ValueError):
+        raise BadRequestException("Invalid pagination cursor")
+    return payload["d"], value, task_id
+
+
+def _keyset_condition(column, value: Any, task_id: uuid.UUID, after: bool):
+    """Rows strictly after (or before) ``(value, task_id)`` in ascending order.
+
+    NULLs sort last in ascending order, matching PostgreSQL's default, so a
+    descending scan of the same index yields them first.
+    """
+    nullable = column.expression.nullable
+    key = tuple_(column, Task.id)
+    bound = tuple_(literal(value, column.type), literal(task_id, Task.id.type))
+
+    if after:
+        if value is None:
+            return and_(column.is_(None), Task.id > task_id)
+        if nullable:
+            return or_(key > bound, column.is_(None))
+        return key > bound
+
+    if value is None:
+        return or_(column.isnot(None), Task.id < task_id)
+    return key < bound
+
+
+async def list_tasks_keyset(
+    db: AsyncSession,
+    status: Optional[str] = None,
+    priority: Optional[str] = None,
+    search: Optional[str] = None,
+    sort_by: str = "created_at",
+    order: str = "desc",
+    limit: int = 10,
+    cursor: Optional[str] = None,
+    tags: Optional[List[str]] = None,
+    assigned_to: Optional[uuid.UUID] = None,
+    count_strategy: str = "exact",
+    fields: Optional[List[str]] = None,
+) -> Tuple[List[dict], int, Optional[str], Optional[str]]:
+    """Cursor-paginated task listing, as JSON-ready dicts.
+
+    Each page seeks directly to the ``(sort column, id)`` position encoded in
+    the cursor instead of skipping rows with OFFSET, so deep pages cost the
+    same as the first one. Pages are cached like ``list_tasks`` pages.
+    """
+    if sort_by == "relevance":
+        raise BadRequestException("Cursor pagination does not support relevance sorting")
+    sort_by = sort_by if sort_by in SORT_FIELDS else "created_at"
+
+    select_fields = None
+    if fields is not None:
+        fields = _resolve_fields(fields)
+        # The cursor needs the sort key even when the caller did not ask for it.
+        select_fields = fields if sort_by in fields else fields + [sort_by]
+
+    signature = _filter_signature(status, priority, search, tags, assigned_to)
+    cache_key = (
+        signature,
+        ("cursor", sort_by, order, cursor, limit, count_strategy, fields and tuple(fields)),
+    )
+    cached = _list_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    conditions = _filter_conditions(status, priority, search, tags, assigned_to)
+    total = await _uncounted_total(db, conditions, count_strategy, signature)
+
+    sort_column = SORT_FIELDS[sort_by]
+    direction = "next"
+    page_conditions = list(conditions)
+
+    if cursor:
+        direction, value, task_id = _decode_task_cursor(cursor, sort_by, order)
+        after = (order == "asc") == (direction == "next")
+        page_conditions.append(_keyset_condition(sort_column, value, task_id, after))
+
+    fetch_order = order
+    if direction == "prev":
+        fetch_order = "desc" if order == "asc" else "asc"
+
+    query = (
+        _page_query(select_fields)
+        .where(and_(*page_conditions))
+        .order_by(*_order_by(sort_by, fetch_order))
+        .limit(limit + 1)
+    )
+    # A window count would only see rows past the cursor, so the total comes
+    # from an uncorrelated subquery that PostgreSQL evaluates once per statement.
+    tasks, total = await _fetch_page(
+        db,
+        query,
+        total,
+        _count_query(conditions).correlate(None).scalar_subquery(),
+        conditions,
+        count_strategy,
+        signature,
+        maybe_past_end=cursor is not None,
+        projected=fields is not None,
+    )
+
+    has_more = len(tasks) > limit
+    tasks = tasks[:limit]
+    if direction == "prev":
+        tasks.reverse()
+
+    next_cursor = prev_cursor = None
+    if tasks:
+        if direction == "next":
+            if has_more:
+                next_cursor = _encode_task_cursor(tasks[-1], sort_by, order, "next")
+            if cursor:
+                prev_cursor = _encode_task_cursor(tasks[0], sort_by, order, "prev")
+        else:
+            next_cursor = _encode_task_cursor(tasks[-1], sort_by, order, "next")
+            if has_more:
+                prev_cursor = _encode_task_cursor(tasks[0], sort_by, order, "prev")
+
+    if fields is not None and sort_by not in fields:
+        for row in tasks:
+            del row[sort_by]
+
+    page_result = (tasks, total, next_cursor, prev_cursor)
+    _list_cache.set(cache_key, page_result)
+    return page_result
+
+
+async def task_version(db: AsyncSession, task_id: uuid.UUID) -> Optional[tuple]:
+    """Validator for a task's detail view, or None if the task is gone.
+
+    Reads the task's ``updated_at`` and the count and latest timestamp of its
+    comments and files without loading any of them.
+    """
+    def child(column, parent):
+        return select(column).where(parent == task_id).scalar_subquery()
+
+    result = await db.execute(
+        select(
+            Task.updated_at,
+            child(func.count(Comment.id), Comment.task_id),
+            child(func.max(Comment.updated_at), Comment.task_id),
+            child(func.count(File.id), File.task_id),
+            child(func.max(File.created_at), File.task_id),
+        ).where(and_(Task.id == task_id, Task.is_deleted == False))  # noqa: E712
+    )
+    row = result.one_or_none()
+    return tuple(row) if row is not None else None
 
 
 async def get_task(db: AsyncSession, task_id: uuid.UUID) -> Task:
@@ -118,10 +664,30 @@ async def get_task(db: AsyncSession, task_id: uuid.UUID) -> Task:
     return task
 
 
+async def _lock_task(db: AsyncSession, task_id: uuid.UUID) -> Task:
+    """Load a live task with ``FOR UPDATE`` so concurrent writes to it serialise.
+
+    The before/after snapshots taken under the lock are what the rollup deltas
+    are computed from; without it two writers can both see the same old state.
+    """
+    result = await db.execute(
+        select(Task)
+        .where(and_(Task.id == task_id, Task.is_deleted == False))  # noqa: E712
+        .with_for_update()
+        .execution_options(populate_existing=True)
+    )
+    task = result.scalar_one_or_none()
+    if not task:
+        raise NotFoundException("Task not found")
+    return task
+
+
 async def update_task(
     db: AsyncSession, task_id: uuid.UUID, data: TaskUpdate, user_id: uuid.UUID
 ) -> Task:
-    task = await get_task(db, task_id)
+    task = await _lock_task(db, task_id)
+    before = _task_state(task)
+    previous_status = task.status
 
     if task.created_by != user_id and task.assigned_to != user_id:
         raise ForbiddenException("You can only update tasks you created or are assigned to")
@@ -138,15 +704,20 @@ async def update_task(
         update_data["description"] = sanitize_string(update_data["description"])
     if "tags" in update_data and update_data["tags"]:
         update_data["tags"] = [sanitize_string(t) for t in update_data["tags"]]
-    if "status" in update_data and update_data["status"]:
-        update_data["status"] = TaskStatus(update_data["status"])
+    new_status = update_data.pop("status", None)
     if "priority" in update_data and update_data["priority"]:
         update_data["priority"] = TaskPriority(update_data["priority"])
 
     for field, value in update_data.items():
         setattr(task, field, value)
 
+    if new_status and TaskStatus(new_status) != previous_status:
+        _set_status(task, TaskStatus(new_status))
+
     await db.flush()
+    if task.status != previous_status:
+        _log_transition(db, task, previous_status, user_id)
+    await _task_written(db, [before], [_task_state(task)])
 
     result = await db.execute(
         select(Task)
@@ -157,14 +728,16 @@ async def update_task(
 
 
 async def delete_task(db: AsyncSession, task_id: uuid.UUID, user_id: uuid.UUID) -> None:
-    task = await get_task(db, task_id)
+    task = await _lock_task(db, task_id)
 
     if task.created_by != user_id:
         raise ForbiddenException("Only the task creator can delete this task")
 
+    before = _task_state(task)
     task.is_deleted = True
     task.deleted_at = datetime.now(timezone.utc)
     await db.flush()
+    await _task_written(db, [before], [_task_state(task)])
 
 
 async def bulk_create_tasks(
@@ -186,10 +759,14 @@ async def bulk_create_tasks(
             assigned_to=data.assigned_to,
             created_by=user_id,
         )
+        _set_status(task, task.status)
         db.add(task)
         created_tasks.append(task)
 
     await db.flush()
+    for task in created_tasks:
+        _log_transition(db, task, None, user_id)
+    await _task_written(db, [], [_task_state(t) for t in created_tasks])
 
     task_ids = [t.id for t in created_tasks]
     result = await db.execute(
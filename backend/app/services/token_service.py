@@ -0,0 +1,67 @@
+import asyncio
+import logging
+import uuid
+from datetime import datetime, timezone
+from typing import Dict
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import async_session
+from app.models.token_epoch import UserTokenEpoch
+
+logger = logging.getLogger(__name__)
+
+# In-memory copy of user_token_epochs, keyed by str(user_id). Checked on every
+# authenticated request and reloaded by ``run_epoch_refresher``, so a
+# revocation made on another worker takes effect within one refresh interval.
+_epochs: Dict[str, int] = {}
+
+
+def is_revoked(user_id: str, epoch: int) -> bool:
+    return epoch < _epochs.get(user_id, 0)
+
+
+async def user_epoch(db: AsyncSession, user_id: uuid.UUID) -> int:
+    """Current epoch straight from the table, for stamping newly issued tokens."""
+    result = await db.execute(
+        select(UserTokenEpoch.epoch).where(UserTokenEpoch.user_id == user_id)
+    )
+    return result.scalar_one_or_none() or 0
+
+
+async def revoke_user_tokens(db: AsyncSession, user_id: uuid.UUID) -> int:
+    """Bump the user's epoch, invalidating every access token issued so far."""
+    stmt = insert(UserTokenEpoch).values(
+        user_id=user_id, epoch=1, updated_at=datetime.now(timezone.utc)
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[UserTokenEpoch.user_id],
+        set_={"epoch": UserTokenEpoch.epoch + 1, "updated_at": stmt.excluded.updated_at},
+    ).returning(UserTokenEpoch.epoch)
+    epoch = (await db.execute(stmt)).scalar_one()
+    _epochs[str(user_id)] = epoch
+    return epoch
+
+
+async def refresh_epochs(db: AsyncSession) -> None:
+    result = await db.execute(
+        select(UserTokenEpoch.user_id, UserTokenEpoch.epoch).where(UserTokenEpoch.epoch > 0)
+    )
+    fresh = {str(user_id): epoch for user_id, epoch in result}
+    # Never step back below an epoch this worker bumped itself.
+    for user_id, epoch in _epochs.items():
+        fresh[user_id] = max(fresh.get(user_id, 0), epoch)
+    _epochs.clear()
+    _epochs.update(fresh)
+
+
+async def run_epoch_refresher(interval: float) -> None:
+    while True:
+        try:
+            async with async_session() as db:
+                await refresh_epochs(db)
+        except Exception:
+            logger.exception("Failed to refresh token epochs")
+        await asyncio.sleep(interval)
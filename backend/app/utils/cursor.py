@@ -0,0 +1,23 @@
+import base64
+import binascii
+import json
+from typing import Any
+
+from app.utils.exceptions import BadRequestException
+
+
+def encode_cursor(payload: dict) -> str:
+    """Serialize a keyset position into an opaque, URL-safe token."""
+    raw = json.dumps(payload, separators=(",", ":"), default=str).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(token: str) -> dict[str, Any]:
+    padded = token + "=" * (-len(token) % 4)
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, ValueError):
+        raise BadRequestException("Invalid pagination cursor")
+    if not isinstance(payload, dict):
+        raise BadRequestException("Invalid pagination cursor")
+    return payload
@@ -0,0 +1,49 @@
+import hashlib
+from typing import Any, Optional
+
+from starlette.responses import Response
+
+# Clients may reuse a stored representation only after revalidating it.
+REVALIDATE = "private, no-cache"
+
+
+def make_etag(*parts: Any) -> str:
+    """Weak ETag derived from a resource's validator values."""
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+    return f'W/"{digest}"'
+
+
+def body_etag(body: bytes) -> str:
+    """Weak ETag derived from a rendered response body."""
+    return f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of ``etag`` against an ``If-None-Match`` header."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def with_etag(response: Response, etag: str) -> Response:
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = REVALIDATE
+    return response
+
+
+def not_modified(etag: str) -> Response:
+    return with_etag(Response(status_code=304), etag)
+
+
+def conditional(response: Response, if_none_match: Optional[str]) -> Response:
+    """Tag ``response`` with its body hash, or answer 304 if the client has it."""
+    etag = body_etag(response.body)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    return with_etag(response, etag)
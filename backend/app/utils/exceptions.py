@@ -1,10 +1,18 @@
+from typing import Dict, Optional
+
 from fastapi import HTTPException, status
 
 
 class AppException(HTTPException):
-    def __init__(self, status_code: int, message: str, code: str = "ERROR"):
+    def __init__(
+        self,
+        status_code: int,
+        message: str,
+        code: str = "ERROR",
+        headers: Optional[Dict[str, str]] = None,
+    ):
         self.code = code
-        super().__init__(status_code=status_code, detail=message)
+        super().__init__(status_code=status_code, detail=message, headers=headers)
 
 
 class NotFoundException(AppException):
@@ -50,3 +58,28 @@ class ConflictException(AppException):
             message=message,
             code="CONFLICT",
         )
+
+
+class RateLimitedException(AppException):
+    def __init__(
+        self,
+        message: str = "Too many requests. Please try again later.",
+        retry_after: int = 1,
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        super().__init__(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            message=message,
+            code="RATE_LIMITED",
+            headers={**(headers or {}), "Retry-After": str(retry_after)},
+        )
+
+
+class ServiceUnavailableException(AppException):
+    def __init__(self, message: str = "Service temporarily unavailable", retry_after: int = 1):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            message=message,
+            code="SERVICE_UNAVAILABLE",
+            headers={"Retry-After": str(retry_after)},
+        )
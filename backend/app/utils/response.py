@@ -1,29 +1,106 @@
 import math
-from typing import Any
+from functools import lru_cache
+from typing import Any, Optional
+
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+from starlette.responses import Response
 
 from app.schemas.common import (
-    SuccessResponse,
-    PaginatedResponse,
+    CacheMeta,
     PaginationMeta,
+    CursorPaginationMeta,
     MessageResponse,
 )
 
 
-def success_response(data: Any) -> dict:
-    return SuccessResponse(data=data).model_dump()
+class JSONBytesResponse(Response):
+    """Response whose body is already-rendered JSON bytes.
+
+    Routers hand over ready bytes, so FastAPI skips ``jsonable_encoder`` and
+    the ``json.dumps`` pass of ``JSONResponse``. The output matches
+    ``JSONResponse`` byte for byte: compact separators, UTF-8, no ASCII escaping.
+    """
+
+    media_type = "application/json"
+
+
+@lru_cache(maxsize=None)
+def _adapter(schema: Any) -> TypeAdapter:
+    return TypeAdapter(schema)
+
+
+def render_json(data: Any, schema: Any = None) -> bytes:
+    """Serialize ``data`` straight to JSON bytes.
+
+    With a ``schema`` (a model or e.g. ``list[Model]``), ORM objects are
+    validated once through a cached ``TypeAdapter`` and dumped by
+    pydantic-core without an intermediate dict.
+    """
+    if schema is None:
+        return to_json(data)
+    adapter = _adapter(schema)
+    return adapter.dump_json(adapter.validate_python(data, from_attributes=True))
+
+
+def success_response(data: Any, schema: Any = None) -> JSONBytesResponse:
+    return JSONBytesResponse(b'{"success":true,"data":' + render_json(data, schema) + b"}")
+
+
+def _with_meta(data: Any, meta, schema: Any) -> JSONBytesResponse:
+    return JSONBytesResponse(
+        b'{"success":true,"data":'
+        + render_json(data, schema)
+        + b',"meta":'
+        + meta.model_dump_json().encode()
+        + b"}"
+    )
+
+
+def _paginated(data: list, meta, item_schema: Any) -> JSONBytesResponse:
+    return _with_meta(data, meta, list[item_schema] if item_schema is not None else None)
+
+
+def paginated_response(
+    data: list,
+    total: int,
+    page: int,
+    limit: int,
+    count_strategy: str = "exact",
+    item_schema: Any = None,
+) -> JSONBytesResponse:
+    meta = PaginationMeta(
+        page=page,
+        limit=limit,
+        total=total,
+        total_pages=math.ceil(total / limit) if limit > 0 else 0,
+        count_strategy=count_strategy,
+    )
+    return _paginated(data, meta, item_schema)
+
+
+def cursor_paginated_response(
+    data: list,
+    total: int,
+    limit: int,
+    next_cursor: Optional[str] = None,
+    prev_cursor: Optional[str] = None,
+    count_strategy: str = "exact",
+    item_schema: Any = None,
+) -> JSONBytesResponse:
+    meta = CursorPaginationMeta(
+        limit=limit,
+        total=total,
+        next_cursor=next_cursor,
+        prev_cursor=prev_cursor,
+        count_strategy=count_strategy,
+    )
+    return _paginated(data, meta, item_schema)
 
 
-def paginated_response(data: list, total: int, page: int, limit: int) -> dict:
-    return PaginatedResponse(
-        data=data,
-        meta=PaginationMeta(
-            page=page,
-            limit=limit,
-            total=total,
-            total_pages=math.ceil(total / limit) if limit > 0 else 0,
-        ),
-    ).model_dump()
+def cached_response(data: Any, meta: CacheMeta, schema: Any = None) -> JSONBytesResponse:
+    return _with_meta(data, meta, schema)
 
 
-def message_response(message: str) -> dict:
-    return MessageResponse(message=message).model_dump()
+def message_response(message: str) -> JSONBytesResponse:
+    return JSONBytesResponse(MessageResponse(message=message).model_dump_json().encode())
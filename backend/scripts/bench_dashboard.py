@@ -0,0 +1,103 @@
+"""Benchmark: combined dashboard query vs. the separate analytics endpoints.
+
+Times ``get_overview`` + ``get_performance`` + ``get_trends`` (each on its own
+session, as separate HTTP requests would run them) against ``get_dashboard``
+at each requested table size, and counts the SQL statements each path issues.
+The same is done for the overview + trends pair the Dashboard page requests
+(``sections=overview,trends``). The analytics cache is bypassed; these are
+cold computations.
+
+Needs a local PostgreSQL database at ``alembic upgrade head``. Tasks are
+seeded with the ``explain_queries`` generator until the table reaches each
+size, so run it against a scratch database.
+
+Usage (from ``backend/``)::
+
+    python -m scripts.bench_dashboard --sizes 100000 1000000 --repeat 5
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from sqlalchemy import event, func, select
+
+from app.core.database import async_session, engine
+from app.models.task import Task
+from app.services import analytics_service
+from scripts.explain_queries import seed
+
+
+SECTION_CALLS = {
+    "overview": analytics_service.get_overview,
+    "performance": analytics_service.get_performance,
+    "trends": analytics_service.get_trends,
+}
+
+
+def separate(sections):
+    async def run() -> None:
+        for section in sections:
+            async with async_session() as db:
+                await SECTION_CALLS[section](db)
+
+    return run
+
+
+def combined(sections):
+    async def run() -> None:
+        async with async_session() as db:
+            await analytics_service.get_dashboard(db, sections=sections)
+
+    return run
+
+
+async def measure(fn, repeat: int):
+    statements = 0
+
+    def _count(*args):
+        nonlocal statements
+        statements += 1
+
+    await fn()  # warm the buffer cache and connection pool
+    event.listen(engine.sync_engine, "before_cursor_execute", _count)
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    event.remove(engine.sync_engine, "before_cursor_execute", _count)
+    return statistics.median(timings), statements // repeat
+
+
+async def run(sizes, repeat: int) -> None:
+    for size in sorted(sizes):
+        async with async_session() as db:
+            existing = (await db.execute(select(func.count(Task.id)))).scalar()
+        if existing < size:
+            print(f"seeding {size - existing} tasks ...")
+            await seed(size - existing)
+
+        print(f"{size} tasks")
+        for sections in (("overview", "performance", "trends"), ("overview", "trends")):
+            separate_ms, separate_statements = await measure(separate(sections), repeat)
+            combined_ms, combined_statements = await measure(combined(sections), repeat)
+            for label, ms, statements in (
+                (" + ".join(sections), separate_ms, separate_statements),
+                (f"dashboard sections={','.join(sections)}", combined_ms, combined_statements),
+            ):
+                print(f"  {label:<48}: {ms:9.1f} ms median, {statements} statements")
+            print(f"  {'speed-up':<48}: {separate_ms / combined_ms:9.2f}x")
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100000, 1000000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(run(args.sizes, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
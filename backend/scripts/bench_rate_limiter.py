@@ -0,0 +1,96 @@
+"""Benchmark: per-request rate-limiter overhead and cross-worker accuracy.
+
+Times ``BucketStore.take`` for the memory and file stores, plus a full
+``RateLimiter.hit`` (identity lookup included) for anonymous and bearer-token
+requests. Then several processes drain one shared bucket at once, and the
+script checks that exactly ``capacity`` requests got through in total.
+
+Usage (from ``backend/``)::
+
+    python -m scripts.bench_rate_limiter --iterations 200000 --workers 4
+"""
+import argparse
+import multiprocessing
+import os
+import tempfile
+import time
+
+from starlette.requests import Request
+
+from app.core.rate_limiter import FileBucketStore, MemoryBucketStore, RateLimiter
+from app.core.security import create_access_token
+from app.utils.exceptions import RateLimitedException
+
+
+def per_call(fn, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations
+
+
+def make_request(token: str = "") -> Request:
+    headers = [(b"authorization", f"Bearer {token}".encode())] if token else []
+    return Request({"type": "http", "headers": headers, "client": ("10.0.0.1", 1234)})
+
+
+def drain(path: str, attempts: int, capacity: int, results) -> None:
+    store = FileBucketStore(path, slots=1024)
+    results.put(sum(store.take("shared", capacity, 0.0)[0] for _ in range(attempts)))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--capacity", type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        memory = MemoryBucketStore()
+        shared = FileBucketStore(os.path.join(tmp, "buckets.bin"))
+        huge = float(args.iterations * 10)
+
+        print("per-call overhead")
+        for label, store in (("memory store", memory), ("file store", shared)):
+            seconds = per_call(lambda: store.take("user:bench", huge, huge), args.iterations)
+            print(f"  {label:<26}: {seconds * 1e6:7.2f} us")
+
+        limiter = RateLimiter(shared)
+        anonymous = make_request()
+        authenticated = make_request(create_access_token({"sub": "bench-user"}))
+        for label, request in (("hit, anonymous", anonymous), ("hit, bearer token", authenticated)):
+            seconds = per_call(
+                lambda: limiter.hit(request, "bench", huge, huge), args.iterations // 10
+            )
+            print(f"  {label:<26}: {seconds * 1e6:7.2f} us")
+
+        try:
+            limiter.hit(anonymous, "bench-empty", 0, 1.0)
+        except RateLimitedException as exc:
+            print(f"  empty bucket -> {exc.status_code}, Retry-After {exc.headers['Retry-After']}")
+
+        path = os.path.join(tmp, "contended.bin")
+        FileBucketStore(path, slots=1024)
+        results = multiprocessing.Queue()
+        attempts = args.capacity  # each worker alone could drain the bucket
+        procs = [
+            multiprocessing.Process(target=drain, args=(path, attempts, args.capacity, results))
+            for _ in range(args.workers)
+        ]
+        for proc in procs:
+            proc.start()
+        allowed = sum(results.get() for _ in procs)
+        for proc in procs:
+            proc.join()
+
+        print(
+            f"{args.workers} workers x {attempts} attempts on one bucket of {args.capacity}: "
+            f"{allowed} allowed"
+        )
+        if allowed != args.capacity:
+            raise SystemExit("Shared bucket admitted the wrong number of requests")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Micro-benchmark: legacy dict-based response pipeline vs. direct-to-bytes rendering.
+
+Renders one task-list page both ways, checks the bodies are byte-identical,
+and reports CPU time per page.
+
+Usage (from ``backend/``)::
+
+    python -m scripts.bench_responses --rows 100 --iterations 2000
+"""
+import argparse
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.schemas.common import PaginatedResponse, PaginationMeta
+from app.schemas.task import TaskResponse
+from app.utils.response import paginated_response
+
+
+def make_tasks(rows: int) -> list:
+    now = datetime.now(timezone.utc)
+    users = [
+        SimpleNamespace(
+            id=uuid.uuid4(),
+            name=f"User {i} Ünïcode",
+            email=f"user{i}@example.com",
+            avatar=None,
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(10)
+    ]
+    return [
+        SimpleNamespace(
+            id=uuid.uuid4(),
+            title=f"Task {i}: ship the thing",
+            description="Line one\nLine two with \"quotes\" and <b>markup</b>" * 3,
+            status=("TODO", "IN_PROGRESS", "DONE")[i % 3],
+            priority=("LOW", "MEDIUM", "HIGH")[i % 3],
+            due_date=now + timedelta(days=i) if i % 4 else None,
+            tags=["backend", f"tag{i}"],
+            assigned_to=users[i % 10].id,
+            created_by=users[(i + 1) % 10].id,
+            is_deleted=False,
+            created_at=now - timedelta(hours=i),
+            updated_at=now,
+            creator=users[(i + 1) % 10],
+            assignee=users[i % 10],
+        )
+        for i in range(rows)
+    ]
+
+
+def legacy_page(tasks: list, total: int) -> bytes:
+    """The previous path: model_dump per row, envelope model_dump, jsonable_encoder, json.dumps."""
+    data = [TaskResponse.model_validate(t).model_dump(mode="json") for t in tasks]
+    content = PaginatedResponse(
+        data=data,
+        meta=PaginationMeta(page=1, limit=len(tasks), total=total, total_pages=1),
+    ).model_dump()
+    return JSONResponse(jsonable_encoder(content)).body
+
+
+def fast_page(tasks: list, total: int) -> bytes:
+    return paginated_response(
+        tasks, total=total, page=1, limit=len(tasks), item_schema=TaskResponse
+    ).body
+
+
+def timed(fn, tasks: list, iterations: int) -> float:
+    start = time.process_time()
+    for _ in range(iterations):
+        fn(tasks, len(tasks))
+    return (time.process_time() - start) / iterations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    tasks = make_tasks(args.rows)
+    legacy, fast = legacy_page(tasks, args.rows), fast_page(tasks, args.rows)
+    if legacy != fast:
+        raise SystemExit("Response bodies differ; the fast path is not byte-identical")
+
+    fast_page(tasks, args.rows)  # warm the TypeAdapter cache
+    legacy_s = timed(legacy_page, tasks, args.iterations)
+    fast_s = timed(fast_page, tasks, args.iterations)
+
+    print(f"{args.rows}-row page, {len(fast)} bytes, bodies identical")
+    print(f"  legacy pipeline : {legacy_s * 1e6:9.1f} us/page")
+    print(f"  bytes pipeline  : {fast_s * 1e6:9.1f} us/page")
+    print(f"  saved           : {(legacy_s - fast_s) * 1e6:9.1f} us/page ({legacy_s / fast_s:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,256 @@
+"""Query-plan regression check for the task filtering paths.
+
+Runs the real service functions against a local PostgreSQL database, captures
+every SELECT they issue, EXPLAINs it, and exits non-zero when a query plans a
+sequential scan over ``tasks``, ``comments``, ``files`` or ``task_status_events``,
+or computes a window aggregate (the list total) over joined rows.
+
+Usage (from ``backend/``, after ``alembic upgrade head``)::
+
+    python -m scripts.explain_queries --seed 200000
+    python -m scripts.explain_queries            # reuse existing data
+
+Seeding inserts synthetic users and tasks so the planner sees realistic row
+counts; on a near-empty table a sequential scan is always the cheapest plan.
+"""
+import argparse
+import asyncio
+import json
+import sys
+from typing import Awaitable, Callable, List, Tuple
+
+from sqlalchemy import event, text
+
+from app.core.database import async_session, engine
+from app.services import (
+    analytics_service,
+    comment_service,
+    file_service,
+    stats_service,
+    task_service,
+)
+
+CHECKED_TABLES = {"tasks", "comments", "files", "task_status_events"}
+
+SEED_USERS_SQL = """
+INSERT INTO users (id, name, email, password, created_at, updated_at)
+SELECT gen_random_uuid(), 'Seed User ' || g, 'seed' || g || '@seed.local', 'x', now(), now()
+FROM generate_series(1, :users) AS g
+ON CONFLICT (email) DO NOTHING
+"""
+
+SEED_TASKS_SQL = """
+WITH u AS (SELECT array_agg(id) AS ids FROM users)
+INSERT INTO tasks (
+    id, title, description, status, priority, due_date, tags,
+    assigned_to, created_by, is_deleted, created_at, updated_at, completed_at
+)
+SELECT
+    gen_random_uuid(),
+    'Seed task ' || g,
+    'Generated task number ' || g || ' for query plan checks',
+    (ARRAY['TODO', 'IN_PROGRESS', 'DONE'])[1 + g % 3]::taskstatus,
+    (ARRAY['LOW', 'MEDIUM', 'HIGH'])[1 + (g + g / 3) % 3]::taskpriority,
+    CASE WHEN g % 4 = 0 THEN NULL ELSE now() + ((g % 60) - 30) * interval '1 day' END,
+    ARRAY[(ARRAY['frontend', 'backend', 'ops', 'design', 'qa'])[1 + g % 5], 'tag' || (g % 500)],
+    CASE WHEN g % 10 = 0 THEN NULL ELSE u.ids[1 + g % array_length(u.ids, 1)] END,
+    u.ids[1 + (g * 7) % array_length(u.ids, 1)],
+    g % 20 = 0,
+    now() - (g % 365) * interval '1 day' - (g % 1440) * interval '1 minute',
+    now() - (g % 180) * interval '1 day',
+    CASE WHEN g % 3 = 2 THEN now() - (g % 180) * interval '1 day' END
+FROM generate_series(1, :tasks) AS g, u
+"""
+
+SEED_EVENTS_SQL = """
+INSERT INTO task_status_events (id, task_id, from_status, to_status, assignee_id, changed_by, created_at)
+SELECT gen_random_uuid(), id, 'IN_PROGRESS', 'DONE', assigned_to, created_by, completed_at
+FROM tasks WHERE completed_at IS NOT NULL
+"""
+
+SEED_COMMENTS_SQL = """
+INSERT INTO comments (id, content, task_id, user_id, created_at, updated_at)
+SELECT gen_random_uuid(), 'Seed comment', t.id, t.created_by, now(), now()
+FROM (SELECT id, created_by FROM tasks ORDER BY random() LIMIT :comments) AS t
+"""
+
+SEED_FILES_SQL = """
+INSERT INTO files (id, filename, original_name, mime_type, size, task_id, uploaded_by, created_at)
+SELECT gen_random_uuid(), md5(t.id::text) || '.txt', 'seed.txt', 'text/plain', 1, t.id, t.created_by, now()
+FROM (SELECT id, created_by FROM tasks ORDER BY random() LIMIT :files) AS t
+"""
+
+
+async def seed(task_count: int) -> None:
+    async with engine.begin() as conn:
+        await conn.execute(text(SEED_USERS_SQL), {"users": max(task_count // 1000, 20)})
+        await conn.execute(text(SEED_TASKS_SQL), {"tasks": task_count})
+        await conn.execute(text(SEED_EVENTS_SQL))
+        await conn.execute(text(SEED_COMMENTS_SQL), {"comments": task_count // 4})
+        await conn.execute(text(SEED_FILES_SQL), {"files": task_count // 20})
+    async with async_session() as db:
+        await stats_service.rebuild_hourly_stats(db)
+        await db.commit()
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(
+            text(
+                "VACUUM ANALYZE users, tasks, comments, files, "
+                "task_hourly_stats, task_status_events"
+            )
+        )
+
+
+def _seq_scans(plan: dict) -> List[str]:
+    found = []
+    if plan.get("Node Type") == "Seq Scan" and plan.get("Relation Name") in CHECKED_TABLES:
+        found.append(plan["Relation Name"])
+    for child in plan.get("Plans", []):
+        found.extend(_seq_scans(child))
+    return found
+
+
+JOIN_NODES = {"Nested Loop", "Hash Join", "Merge Join"}
+
+
+def _has_join(plan: dict) -> bool:
+    return plan.get("Node Type") in JOIN_NODES or any(
+        _has_join(child) for child in plan.get("Plans", [])
+    )
+
+
+def _joined_windows(plan: dict) -> int:
+    """Window aggregates computed over a join, i.e. over every joined row."""
+    found = int(plan.get("Node Type") == "WindowAgg" and _has_join(plan))
+    for child in plan.get("Plans", []):
+        found += _joined_windows(child)
+    return found
+
+
+Case = Tuple[str, Callable[..., Awaitable]]
+
+
+def build_cases(user_id, task_id, file_id) -> List[Case]:
+    return [
+        ("list_tasks default", lambda db: task_service.list_tasks(db)),
+        ("list_tasks deep page", lambda db: task_service.list_tasks(db, page=500)),
+        ("list_tasks status", lambda db: task_service.list_tasks(db, status="IN_PROGRESS")),
+        ("list_tasks priority", lambda db: task_service.list_tasks(db, priority="HIGH")),
+        ("list_tasks tags", lambda db: task_service.list_tasks(db, tags=["tag42"])),
+        ("list_tasks assignee", lambda db: task_service.list_tasks(db, assigned_to=user_id)),
+        (
+            "list_tasks due_date asc",
+            lambda db: task_service.list_tasks(db, sort_by="due_date", order="asc"),
+        ),
+        (
+            "list_tasks updated_at",
+            lambda db: task_service.list_tasks(db, sort_by="updated_at"),
+        ),
+        ("list_tasks title", lambda db: task_service.list_tasks(db, sort_by="title")),
+        ("list_tasks_keyset", lambda db: task_service.list_tasks_keyset(db)),
+        ("get_task", lambda db: task_service.get_task(db, task_id)),
+        ("task_version", lambda db: task_service.task_version(db, task_id)),
+        ("list_comments", lambda db: comment_service.list_comments(db, task_id)),
+        ("comments_version", lambda db: comment_service.comments_version(db, task_id)),
+        ("get_file", lambda db: file_service.get_file(db, task_id, file_id)),
+        ("analytics overview (assignee)", lambda db: analytics_service.get_overview(db, user_id)),
+        (
+            "analytics performance (assignee)",
+            lambda db: analytics_service.get_performance(db, user_id),
+        ),
+        (
+            "analytics trends",
+            lambda db: analytics_service.get_trends(db, days=7),
+        ),
+        (
+            "analytics trends monthly",
+            lambda db: analytics_service.get_trends(db, days=365, granularity="month"),
+        ),
+        (
+            "analytics trends weekly (client timezone)",
+            lambda db: analytics_service.get_trends(
+                db, days=90, granularity="week", tz="America/New_York"
+            ),
+        ),
+    ]
+
+
+async def run(task_count: int) -> int:
+    if task_count:
+        await seed(task_count)
+
+    async with async_session() as db:
+        row = (
+            await db.execute(
+                text(
+                    "SELECT t.assigned_to, t.id, f.id FROM tasks t "
+                    "JOIN files f ON f.task_id = t.id "
+                    "WHERE NOT t.is_deleted AND t.assigned_to IS NOT NULL LIMIT 1"
+                )
+            )
+        ).first()
+    if row is None:
+        print("No seeded data found; run with --seed N first.")
+        return 2
+    user_id, task_id, file_id = row
+
+    captured: List[Tuple[str, object]] = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        # EXPLAIN statements issued below start with "EXPLAIN" and are skipped.
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _capture)
+
+    failures = 0
+    for name, call in build_cases(user_id, task_id, file_id):
+        async with async_session() as db:
+            captured.clear()
+            try:
+                await call(db)
+            except Exception as exc:  # the plan is what matters, not the result
+                print(f"  note: {name} raised {type(exc).__name__}: {exc}")
+            statements = list(captured)
+
+            conn = await db.connection()
+            for statement, parameters in statements:
+                result = await conn.exec_driver_sql(
+                    "EXPLAIN (FORMAT JSON) " + statement, parameters
+                )
+                raw = result.scalar()
+                plan = (json.loads(raw) if isinstance(raw, str) else raw)[0]["Plan"]
+                scans = _seq_scans(plan)
+                windows = _joined_windows(plan)
+                failed = bool(scans or windows)
+                failures += failed
+                summary = " ".join(statement.split())[:100]
+                print(f"[{'FAIL' if failed else 'ok':4}] {name}: {summary}")
+                if scans:
+                    print(f"       sequential scan on: {', '.join(sorted(set(scans)))}")
+                if windows:
+                    print("       window aggregate computed over joined rows")
+            await db.rollback()
+
+    event.remove(engine.sync_engine, "before_cursor_execute", _capture)
+    await engine.dispose()
+
+    print(f"\n{failures} statement(s) fell back to a sequential scan or joined window")
+    return 1 if failures else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        metavar="N",
+        help="insert N synthetic tasks (plus users, comments, files) before checking",
+    )
+    args = parser.parse_args()
+    sys.exit(asyncio.run(run(args.seed)))
+
+
+if __name__ == "__main__":
+    main()
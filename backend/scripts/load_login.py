@@ -0,0 +1,124 @@
+"""Load test: latency of an unrelated route during a login storm.
+
+A probe calls ``GET /api/health`` on the ASGI app every few milliseconds
+while a burst of bcrypt verifications runs, once calling bcrypt inline on the
+event loop (the old behaviour) and once through the password pool. The probe
+p50/p99 should stay flat with the pool and balloon inline. No database or
+HTTP client is needed; requests are driven through the ASGI interface.
+
+Usage (from ``backend/``)::
+
+    python -m scripts.load_login --logins 40 --concurrency 20
+"""
+import argparse
+import asyncio
+import time
+from typing import Awaitable, Callable, List
+
+from app.core.security import hash_password, password_pool, verify_password, verify_password_async
+from app.main import app
+from app.utils.exceptions import ServiceUnavailableException
+
+
+async def asgi_get(path: str) -> int:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"loadtest")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("loadtest", 80),
+    }
+    status = 0
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+async def probe(stop: asyncio.Event, interval: float) -> List[float]:
+    samples = []
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asgi_get("/api/health")
+        samples.append(time.perf_counter() - start)
+        await asyncio.sleep(interval)
+    return samples
+
+
+async def storm(
+    login: Callable[[], Awaitable[None]], logins: int, concurrency: int
+) -> int:
+    gate = asyncio.Semaphore(concurrency)
+    rejected = 0
+
+    async def one():
+        nonlocal rejected
+        async with gate:
+            try:
+                await login()
+            except ServiceUnavailableException:
+                rejected += 1
+
+    await asyncio.gather(*(one() for _ in range(logins)))
+    return rejected
+
+
+async def measure(label: str, login, args) -> None:
+    stop = asyncio.Event()
+    probe_task = asyncio.create_task(probe(stop, args.interval))
+    await asyncio.sleep(0.2)
+    start = time.perf_counter()
+    rejected = await storm(login, args.logins, args.concurrency) if login else 0
+    if login is None:
+        await asyncio.sleep(args.baseline)
+    elapsed = time.perf_counter() - start
+    stop.set()
+    samples = sorted(await probe_task)
+
+    def pct(q: float) -> float:
+        return samples[min(len(samples) - 1, int(q * len(samples)))] * 1000
+
+    print(
+        f"{label:<10} {elapsed:6.2f}s  probes={len(samples):<5} "
+        f"p50={pct(0.50):8.2f} ms  p99={pct(0.99):8.2f} ms  rejected={rejected}"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=40)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--interval", type=float, default=0.005, help="seconds between probes")
+    parser.add_argument("--baseline", type=float, default=1.0, help="seconds of idle probing")
+    args = parser.parse_args()
+
+    hashed = hash_password("correct horse battery staple")
+
+    async def inline_login():
+        verify_password("correct horse battery staple", hashed)
+
+    async def pooled_login():
+        await verify_password_async("correct horse battery staple", hashed)
+
+    await measure("idle", None, args)
+    await measure("inline", inline_login, args)
+    await measure("pool", pooled_login, args)
+    print(f"pool stats: {password_pool.stats()}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,25 @@
+"""Rebuild the task_hourly_stats rollup from the tasks table.
+
+Safe to run on a live system: the rollup is locked for the duration, so task
+writes made meanwhile are applied on top of the rebuilt counts.
+
+Usage (from ``backend/``)::
+
+    python -m scripts.rebuild_hourly_stats
+"""
+import asyncio
+
+from app.core.database import async_session, engine
+from app.services.stats_service import rebuild_hourly_stats
+
+
+async def main() -> None:
+    async with async_session() as db:
+        rows = await rebuild_hourly_stats(db)
+        await db.commit()
+    await engine.dispose()
+    print(f"Rebuilt task_hourly_stats: {rows} rows")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -89,6 +89,7 @@ export default function TaskFilters({ filters, onFilterChange }: TaskFiltersProp
             <option value="priority">Priority</option>
             <option value="due_date">Due Date</option>
             <option value="status">Status</option>
+            <option value="relevance">Relevance</option>
           </select>
         </div>
 
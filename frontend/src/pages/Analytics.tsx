@@ -50,7 +50,7 @@ export default function Analytics() {
     try {
       const [perfData, trendsData] = await Promise.all([
         analyticsService.getPerformance(query),
-        analyticsService.getTrends(days, query),
+        analyticsService.getTrends(days, query, days > 30 ? 'week' : 'day'),
       ]);
       setPerformance(perfData);
       setTrends(trendsData);
@@ -94,18 +94,7 @@ export default function Analytics() {
     return h > 0 ? `${d}d ${h}h` : `${d}d`;
   };
 
-  const weeklyTrends = trends.reduce<TrendData[]>((acc, item, i) => {
-    if (i % 7 === 0) {
-      acc.push({ date: item.date, created: 0, completed: 0 });
-    }
-    const week = acc[acc.length - 1];
-    week.created += item.created;
-    week.completed += item.completed;
-    return acc;
-  }, []);
-
   const showWeekly = days > 30;
-  const chartData = showWeekly ? weeklyTrends : trends;
 
   const tooltipStyle = {
     fontSize: '12px',
@@ -173,7 +162,7 @@ export default function Analytics() {
 
         <div className="chart-card">
           <ResponsiveContainer width="100%" height={280}>
-            <LineChart data={chartData}>
+            <LineChart data={trends}>
               <CartesianGrid strokeDasharray="3 3" stroke={c.grid} />
               <XAxis
                 dataKey="date"
@@ -194,8 +183,8 @@ export default function Analytics() {
                 }}
               />
               <Legend iconSize={8} wrapperStyle={{ fontSize: '11px', color: c.legendText }} />
-              <Line type="monotone" dataKey="created" name="Created" stroke={c.lineA} strokeWidth={2} dot={chartData.length <= 31} />
-              <Line type="monotone" dataKey="completed" name="Completed" stroke={c.lineB} strokeWidth={2} dot={chartData.length <= 31} />
+              <Line type="monotone" dataKey="created" name="Created" stroke={c.lineA} strokeWidth={2} dot={trends.length <= 31} />
+              <Line type="monotone" dataKey="completed" name="Completed" stroke={c.lineB} strokeWidth={2} dot={trends.length <= 31} />
             </LineChart>
           </ResponsiveContainer>
         </div>
@@ -203,7 +192,7 @@ export default function Analytics() {
         <div className="chart-card" style={{ marginTop: '12px' }}>
           <h3>Daily Volume</h3>
           <ResponsiveContainer width="100%" height={200}>
-            <BarChart data={chartData} barSize={showWeekly ? 16 : 8}>
+            <BarChart data={trends} barSize={showWeekly ? 16 : 8}>
               <CartesianGrid strokeDasharray="3 3" stroke={c.grid} />
               <XAxis
                 dataKey="date"
@@ -67,12 +67,12 @@ export default function Dashboard() {
     setError('');
     const query: AnalyticsQuery = myTasksOnly && user ? { assigned_to: user.id } : {};
     try {
-      const [overviewData, trendsData] = await Promise.all([
-        analyticsService.getOverview(query),
-        analyticsService.getTrends(undefined, query),
+      const data = await analyticsService.getDashboard(undefined, query, 'day', [
+        'overview',
+        'trends',
       ]);
-      setOverview(overviewData);
-      setTrends(trendsData);
+      setOverview(data.overview ?? null);
+      setTrends(data.trends ?? []);
     } catch {
       setError('Failed to load dashboard data');
     } finally {
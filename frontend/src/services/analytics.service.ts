@@ -1,5 +1,5 @@
 import api from './api';
-import type { ApiResponse } from '../types';
+import type { CachedResponse } from '../types';
 
 export interface OverviewData {
   total: number;
@@ -13,6 +13,8 @@ export interface PerformanceData {
   user_name: string;
   completed_tasks: number;
   avg_completion_time: number;
+  avg_cycle_time: number;
+  completed_last_7_days: number;
 }
 
 export interface TrendData {
@@ -21,28 +23,74 @@ export interface TrendData {
   completed: number;
 }
 
+export interface CompletionTime {
+  avg: number;
+  p50: number;
+  p90: number;
+}
+
+export interface DashboardPerformance extends PerformanceData {
+  p50_completion_time: number;
+  p90_completion_time: number;
+}
+
+export type DashboardSection = 'overview' | 'performance' | 'trends';
+
+// Only the requested sections are present; completion_time comes with performance.
+export interface DashboardData {
+  overview?: OverviewData & { completion_time?: CompletionTime };
+  performance?: DashboardPerformance[];
+  trends?: TrendData[];
+}
+
 export interface AnalyticsQuery {
   assigned_to?: string;
 }
 
+export type TrendGranularity = 'day' | 'week' | 'month';
+
+const browserTimeZone = Intl.DateTimeFormat().resolvedOptions().timeZone || 'UTC';
+
 export const analyticsService = {
+  async getDashboard(
+    days?: number,
+    query?: AnalyticsQuery,
+    granularity: TrendGranularity = 'day',
+    sections: DashboardSection[] = ['overview', 'performance', 'trends'],
+  ): Promise<DashboardData> {
+    const response = await api.get<CachedResponse<DashboardData>>('/analytics/dashboard', {
+      params: {
+        ...(days ? { days } : {}),
+        granularity,
+        tz: browserTimeZone,
+        sections: sections.join(','),
+        ...query,
+      },
+    });
+    return response.data.data;
+  },
+
   async getOverview(query?: AnalyticsQuery): Promise<OverviewData> {
-    const response = await api.get<ApiResponse<OverviewData>>('/analytics/overview', {
+    const response = await api.get<CachedResponse<OverviewData>>('/analytics/overview', {
       params: query,
     });
     return response.data.data;
   },
 
   async getPerformance(query?: AnalyticsQuery): Promise<PerformanceData[]> {
-    const response = await api.get<ApiResponse<PerformanceData[]>>('/analytics/performance', {
+    const response = await api.get<CachedResponse<PerformanceData[]>>('/analytics/performance', {
       params: query,
     });
     return response.data.data;
   },
 
-  async getTrends(days?: number, query?: AnalyticsQuery): Promise<TrendData[]> {
-    const response = await api.get<ApiResponse<TrendData[]>>('/analytics/trends', {
-      params: { ...(days ? { days } : {}), ...query },
+  async getTrends(
+    days?: number,
+    query?: AnalyticsQuery,
+    granularity: TrendGranularity = 'day',
+  ): Promise<TrendData[]> {
+    const response = await api.get<CachedResponse<TrendData[]>>('/analytics/trends', {
+      params: { ...(days ? { days } : {}), granularity, tz: browserTimeZone, ...query },
     });
     return response.data.data;
   },
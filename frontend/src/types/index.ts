@@ -54,6 +54,7 @@ export interface FileAttachment {
   original_name: string;
   mime_type: string;
   size: number;
+  sha256: string | null;
   task_id: string;
   uploaded_by: string;
   created_at: string;
@@ -78,6 +79,18 @@ export interface PaginatedResponse<T> {
   meta: PaginationMeta;
 }
 
+export interface CacheMeta {
+  computed_at: string;
+  age_seconds: number;
+  stale: boolean;
+}
+
+export interface CachedResponse<T> {
+  success: boolean;
+  data: T;
+  meta: CacheMeta;
+}
+
 export interface ApiError {
   success: boolean;
   error: {